@@ -0,0 +1,285 @@
+import time
+from .constants import AI_WEIGHTS, AI_BEAM_WIDTH, AI_TIME_BUDGET, AI_TABLE_SIZE
+from .lru import LRUCache
+from .tetris import PIECE_CELLS, PIECE_MASKS, PIECE_SIZES, PIECE_BOTTOMS, zobrist_keys, zobrist_hash
+
+
+def _build_search_tables():
+    """预计算每种方块不重复的旋转方向，以及每个方向各列最高方块的行偏移"""
+    distinct, tops = [], []
+    for shape_cells in PIECE_CELLS:
+        rotations, seen = [], set()
+        for rotation, cells in enumerate(shape_cells):
+            if cells not in seen:
+                seen.add(cells)
+                rotations.append(rotation)
+        distinct.append(tuple(rotations))
+        tops.append(tuple(
+            tuple(min(y for x, y in cells if x == column) for column in range(max(x for x, _ in cells) + 1))
+            for cells in shape_cells
+        ))
+    return tuple(distinct), tuple(tops)
+
+
+# 以 [shape_index] 索引的不重复方向（O 只有 1 个，I/S/Z 有 2 个），以及 [shape_index][rotation] 的列顶部偏移
+DISTINCT_ROTATIONS, PIECE_TOPS = _build_search_tables()
+
+
+def _fits(rows, masks, x, y):
+    """检查方块在位掩码棋盘上是否与已锁定方块重叠（边界由调用方保证）"""
+    for row_y, mask in enumerate(masks):
+        grid_y = y + row_y
+        if grid_y >= 0 and rows[grid_y] & (mask << x):
+            return False
+    return True
+
+
+def surface_metrics(rows, width, height):
+    """从行位掩码计算每列高度与空洞数"""
+    heights = [0] * width
+    holes = 0
+    seen = 0
+    for y, mask in enumerate(rows):
+        holes += (seen & ~mask).bit_count()
+        new_columns = mask & ~seen
+        while new_columns:
+            low_bit = new_columns & -new_columns
+            heights[low_bit.bit_length() - 1] = height - y
+            new_columns ^= low_bit
+        seen |= mask
+    return heights, holes
+
+
+def iter_placements(rows, heights, shape_index, width, height):
+    """枚举方块从出生点可到达的所有最终落点，生成 (rotation, x, y)
+
+    可到达指：在出生行原地旋转到目标方向后水平平移到目标列，再直接下落。
+    """
+    spawn_x = width // 2 - PIECE_SIZES[shape_index][0][0] // 2
+    for rotation in DISTINCT_ROTATIONS[shape_index]:
+        masks = PIECE_MASKS[shape_index][rotation]
+        piece_width, piece_height = PIECE_SIZES[shape_index][rotation]
+        start = min(spawn_x, width - piece_width)
+        if not _fits(rows, masks, start, 0):
+            continue
+
+        left = start
+        while left > 0 and _fits(rows, masks, left - 1, 0):
+            left -= 1
+        right = start
+        while right < width - piece_width and _fits(rows, masks, right + 1, 0):
+            right += 1
+
+        bottoms = PIECE_BOTTOMS[shape_index][rotation]
+        for x in range(left, right + 1):
+            y = height
+            for column, bottom in enumerate(bottoms):
+                column_y = height - heights[x + column] - 1 - bottom
+                if column_y < y:
+                    y = column_y
+            if y < 0:
+                # 出生行下方有悬空结构，逐行下落
+                y = 0
+                while y + piece_height < height and _fits(rows, masks, x, y + 1):
+                    y += 1
+            yield rotation, x, y
+
+
+def place(rows, heights, holes, shape_index, rotation, x, y, width, height):
+    """在位掩码棋盘上放置方块并消行，返回 (rows, heights, holes, lines)"""
+    new_rows = list(rows)
+    for row_y, mask in enumerate(PIECE_MASKS[shape_index][rotation]):
+        new_rows[y + row_y] |= mask << x
+
+    full_row = (1 << width) - 1
+    piece_height = PIECE_SIZES[shape_index][rotation][1]
+    lines = 0
+    for row_y in range(y, y + piece_height):
+        if new_rows[row_y] == full_row:
+            del new_rows[row_y]
+            new_rows.insert(0, 0)
+            lines += 1
+
+    bottoms = PIECE_BOTTOMS[shape_index][rotation]
+    resting = all(y + bottom < height - heights[x + column] for column, bottom in enumerate(bottoms))
+    if lines or not resting:
+        new_heights, new_holes = surface_metrics(new_rows, width, height)
+        return new_rows, new_heights, new_holes, lines
+
+    # 未消行且方块落在表面之上：只有方块所在列的高度和空洞数会变化
+    new_heights = list(heights)
+    new_holes = holes
+    for column, (top, bottom) in enumerate(zip(PIECE_TOPS[shape_index][rotation], bottoms)):
+        grid_x = x + column
+        new_holes += height - heights[grid_x] - 1 - (y + bottom)
+        new_heights[grid_x] = height - (y + top)
+    return new_rows, new_heights, new_holes, lines
+
+
+def evaluate(heights, holes, lines, weights=AI_WEIGHTS):
+    """按加权启发式为局面打分（越高越好）"""
+    bumpiness = 0
+    previous = heights[0]
+    for column_height in heights[1:]:
+        bumpiness += abs(column_height - previous)
+        previous = column_height
+    return (weights['aggregate_height'] * sum(heights)
+            + weights['lines'] * lines
+            + weights['holes'] * holes
+            + weights['bumpiness'] * bumpiness)
+
+
+class Bot:
+    """落点搜索 AI：枚举当前方块的全部落点，选出启发式得分最高的一个"""
+
+    def __init__(self, weights=None):
+        """初始化 AI"""
+        self.weights = dict(AI_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+
+    def best_placement(self, board):
+        """返回当前方块的最佳落点 (rotation, x)，没有可用落点时返回 None"""
+        piece = board.current_piece
+        if not piece:
+            return None
+
+        width, height = board.width, board.height
+        rows, heights = board.rows, board.heights
+        _, holes = surface_metrics(rows, width, height)
+        best, best_score = None, None
+        for rotation, x, y in iter_placements(rows, heights, piece.shape_index, width, height):
+            _, new_heights, new_holes, lines = place(
+                rows, heights, holes, piece.shape_index, rotation, x, y, width, height
+            )
+            score = evaluate(new_heights, new_holes, lines, self.weights)
+            if best_score is None or score > best_score:
+                best, best_score = (rotation, x), score
+        return best
+
+    def __call__(self, board):
+        """作为走子策略使用：board -> (rotation, x)"""
+        return self.best_placement(board)
+
+    def play(self, session) -> int:
+        """在无界面会话中放置一个方块，返回消除的行数"""
+        placement = self.best_placement(session.board)
+        if placement:
+            session.board.place_piece(*placement)
+        return session.hard_drop()
+
+
+class TranspositionTable(LRUCache):
+    """有界置换表
+
+    以 Zobrist 哈希为键缓存局面展开与最佳落点，超出容量时按 LRU 淘汰，
+    并记录命中/未命中次数以便调整容量。
+    """
+
+    def __init__(self, max_entries: int = AI_TABLE_SIZE):
+        """初始化置换表"""
+        super().__init__(max_entries)
+
+
+class BeamSearchBot(Bot):
+    """前瞻 AI：对当前方块与预览方块的落点序列做束搜索
+
+    每层只保留启发式得分最高的 beam_width 个局面继续展开；超出时间预算时
+    立即返回已展开部分中的最佳结果，因此可以直接在帧循环里调用。
+    局面展开与最佳落点缓存在置换表中，不同顺序到达的相同局面只计算一次。
+    """
+
+    def __init__(self, weights=None, beam_width: int = AI_BEAM_WIDTH,
+                 time_budget: float = AI_TIME_BUDGET, table_size: int = AI_TABLE_SIZE):
+        """初始化前瞻 AI"""
+        super().__init__(weights)
+        self.beam_width = beam_width
+        self.time_budget = time_budget
+        self.table = TranspositionTable(table_size)
+        self.nodes = 0
+
+    def best_placement(self, board):
+        """返回当前方块的最佳落点 (rotation, x)，没有可用落点时返回 None"""
+        if not board.current_piece:
+            return None
+        pieces = [board.current_piece.shape_index]
+        if board.next_piece:
+            pieces.append(board.next_piece.shape_index)
+        return self.search(board, pieces)
+
+    def _expand(self, rows, heights, holes, board_hash, shape_index, width, height, keys):
+        """展开局面的全部落点，返回 (rotation, x, 行掩码, 列高度, 空洞数, 消行数, 哈希, 静态得分) 元组"""
+        table_key = ('children', board_hash, shape_index)
+        children = self.table.get(table_key)
+        if children is not None:
+            return children
+
+        children = []
+        for rotation, x, y in iter_placements(rows, heights, shape_index, width, height):
+            new_rows, new_heights, new_holes, lines = place(
+                rows, heights, holes, shape_index, rotation, x, y, width, height
+            )
+            if lines:
+                child_hash = zobrist_hash(new_rows, keys)
+            else:
+                child_hash = board_hash
+                for cell_x, cell_y in PIECE_CELLS[shape_index][rotation]:
+                    child_hash ^= keys[y + cell_y][x + cell_x]
+            # 消行项与路径有关，单独累加；其余项只取决于局面
+            static_score = evaluate(new_heights, new_holes, 0, self.weights)
+            children.append((
+                rotation, x, tuple(new_rows), new_heights, new_holes, lines, child_hash, static_score
+            ))
+        children = tuple(children)
+        self.table.store(table_key, children)
+        self.nodes += 1
+        return children
+
+    def search(self, board, pieces):
+        """按顺序放置 pieces 中的方块做束搜索，返回第一步的落点"""
+        best_key = ('best', board.hash, tuple(pieces), self.beam_width)
+        cached = self.table.get(best_key)
+        if cached is not None:
+            return cached
+
+        deadline = time.perf_counter() + self.time_budget
+        width, height = board.width, board.height
+        keys = zobrist_keys(width, height)
+        _, holes = surface_metrics(board.rows, width, height)
+        lines_weight = self.weights['lines']
+
+        # 束中每个节点：(得分, 第一步落点, 行掩码, 列高度, 空洞数, 累计消行数, 哈希)
+        beam = [(0, None, board.rows, board.heights, holes, 0, board.hash)]
+        best = None
+        completed = True
+        self.nodes = 0
+        for shape_index in pieces:
+            # 以哈希去重：不同落点顺序得到的相同局面只保留一个
+            candidates = {}
+            for _, first_move, rows, heights, holes, lines, board_hash in beam:
+                for rotation, x, new_rows, new_heights, new_holes, new_lines, child_hash, static_score in self._expand(
+                    rows, heights, holes, board_hash, shape_index, width, height, keys
+                ):
+                    total_lines = lines + new_lines
+                    score = static_score + lines_weight * total_lines
+                    existing = candidates.get(child_hash)
+                    if existing is None or score > existing[0]:
+                        candidates[child_hash] = (
+                            score, first_move or (rotation, x), new_rows, new_heights, new_holes,
+                            total_lines, child_hash
+                        )
+                if time.perf_counter() > deadline:
+                    completed = False
+                    break
+            if not candidates:
+                break
+
+            # 剪枝：只保留得分最高的 beam_width 个局面
+            beam = sorted(candidates.values(), key=lambda node: node[0], reverse=True)[:self.beam_width]
+            best = beam[0][1]
+            if not completed:
+                break
+
+        if completed and best is not None:
+            self.table.store(best_key, best)
+        return best
@@ -0,0 +1,73 @@
+import os
+import pygame
+from .constants import THEMES, PIECE_COLORS, COLORS, GRID_SIZE
+
+# 预览方块的格子间距与贴图边长
+PREVIEW_SIZE = 20
+PREVIEW_TILE = 18
+
+
+class BlockAtlas:
+    """方块贴图集
+
+    每个主题构建一次：把所有方块、幽灵方块、预览方块与 AI 提示框预先绘制到同一张
+    Surface 上，渲染时用 ``Surface.blits`` 一次性批量绘制，不再逐格调用 ``pygame.draw.rect``。
+    ``assets/themes/<主题名小写>/`` 下的 ``block_1.png`` ~ ``block_7.png`` 与 ``ghost.png``
+    会覆盖默认绘制的贴图，缺失的文件使用默认样式。
+    """
+
+    def __init__(self, theme_name: str, base_dir: str = None):
+        """构建指定主题的贴图集"""
+        self.theme_name = theme_name
+        self.theme = THEMES.get(theme_name, THEMES['CLASSIC'])
+        self.themes_dir = os.path.join(base_dir, 'assets', 'themes', theme_name.lower()) if base_dir else None
+        self.areas = {}
+        self.surface = pygame.Surface((len(PIECE_COLORS) * GRID_SIZE, 3 * GRID_SIZE), pygame.SRCALPHA)
+        self._build()
+
+    def _build(self):
+        tile = GRID_SIZE - 1
+        for i, color in enumerate(PIECE_COLORS):
+            block = self._load_image(f'block_{i + 1}.png')
+            block_area = pygame.Rect(i * GRID_SIZE, 0, tile, tile)
+            preview_area = pygame.Rect(i * GRID_SIZE, GRID_SIZE, PREVIEW_TILE, PREVIEW_TILE)
+            if block:
+                self.surface.blit(pygame.transform.smoothscale(block, block_area.size), block_area)
+                self.surface.blit(pygame.transform.smoothscale(block, preview_area.size), preview_area)
+            else:
+                self.surface.fill(color, block_area)
+                self.surface.fill(color, preview_area)
+            self.areas[('block', i)] = block_area
+            self.areas[('preview', i)] = preview_area
+
+        ghost_area = pygame.Rect(0, 2 * GRID_SIZE, tile, tile)
+        ghost = self._load_image('ghost.png')
+        if ghost:
+            self.surface.blit(pygame.transform.smoothscale(ghost, ghost_area.size), ghost_area)
+        else:
+            pygame.draw.rect(self.surface, self.theme['ghost'], ghost_area, 1)
+        self.areas['ghost'] = ghost_area
+
+        hint_area = pygame.Rect(GRID_SIZE, 2 * GRID_SIZE, tile, tile)
+        pygame.draw.rect(self.surface, COLORS['YELLOW'], hint_area, 2)
+        self.areas['hint'] = hint_area
+
+        self.surface = self.surface.convert_alpha()
+
+    def _load_image(self, filename: str):
+        """加载主题目录中的贴图，不存在或加载失败时返回 None"""
+        if not self.themes_dir:
+            return None
+        path = os.path.join(self.themes_dir, filename)
+        if not os.path.exists(path):
+            return None
+        try:
+            return pygame.image.load(path).convert_alpha()
+        except (pygame.error, ValueError) as e:
+            print(f"加载主题贴图失败: {e}")
+            return None
+
+    def sprites(self, key, positions):
+        """生成可直接传给 ``Surface.blits`` 的 (贴图集, 位置, 区域) 序列"""
+        area = self.areas[key]
+        return [(self.surface, position, area) for position in positions]
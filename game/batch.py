@@ -0,0 +1,168 @@
+try:
+    import numpy as np
+except ImportError:  # numpy 是可选依赖，只有批量模拟需要
+    np = None
+
+from .constants import SHAPES, GRID_WIDTH, GRID_HEIGHT
+from .tetris import PIECE_CELLS, PIECE_SIZES, ROTATION_COUNT, WALL_KICKS
+
+
+class BatchBoard:
+    """批量游戏板
+
+    以一个 (K, 高, 宽) 的 uint8 数组同时保存 K 个游戏板，移动、旋转、锁定与消行
+    都对所有棋盘做向量化运算，规则与 ``GameBoard`` 的 ``move_piece``、``rotate_piece``、
+    ``lock_piece`` 和 ``clear_lines`` 一致。各方法的 mask 参数是长度为 K 的布尔数组，
+    用于选择参与操作的棋盘，默认是所有未结束的棋盘。
+    """
+
+    def __init__(self, count: int, width: int = GRID_WIDTH, height: int = GRID_HEIGHT, seed=None):
+        """初始化批量游戏板"""
+        if np is None:
+            raise ImportError("BatchBoard 需要 numpy，请先执行 pip install numpy")
+
+        self.count = count
+        self.width = width
+        self.height = height
+        self.rng = np.random.default_rng(seed)
+        self.grids = np.zeros((count, height, width), dtype=np.uint8)
+
+        # 预计算表：[shape_index, rotation, cell] -> (x, y)，以及每个方向的宽度
+        self._cells = np.array(PIECE_CELLS, dtype=np.int64)
+        self._widths = np.array(PIECE_SIZES, dtype=np.int64)[:, :, 0]
+        self._boards = np.arange(count)
+
+        # 当前方块状态（每个棋盘一个）
+        self.shape_index = np.zeros(count, dtype=np.int64)
+        self.rotation = np.zeros(count, dtype=np.int64)
+        self.x = np.zeros(count, dtype=np.int64)
+        self.y = np.zeros(count, dtype=np.int64)
+        self.next_shape_index = self._random_shapes(count)
+        self.active = np.ones(count, dtype=bool)
+        self.reset()
+
+    def _random_shapes(self, n):
+        return self.rng.integers(0, len(SHAPES), size=n)
+
+    def _select(self, mask):
+        return self.active if mask is None else mask & self.active
+
+    def reset(self, mask=None):
+        """重置游戏板并生成新方块"""
+        mask = np.ones(self.count, dtype=bool) if mask is None else mask
+        self.grids[mask] = 0
+        self.active[mask] = True
+        return self.create_new_pieces(mask)
+
+    def create_new_pieces(self, mask=None):
+        """为选中的棋盘生成新方块，返回各棋盘是否仍可继续（无法放置即游戏结束）"""
+        mask = self._select(mask)
+        n = int(mask.sum())
+        self.shape_index[mask] = self.next_shape_index[mask]
+        self.next_shape_index[mask] = self._random_shapes(n)
+        self.rotation[mask] = 0
+        self.x[mask] = self.width // 2 - self._widths[self.shape_index[mask], 0] // 2
+        self.y[mask] = 0
+
+        valid = self._is_valid_position(mask)
+        self.active[mask & ~valid] = False
+        return valid | ~mask
+
+    def _is_valid_position(self, mask, dx=0, dy=0, rotation=None):
+        """批量检查方块位置是否有效，返回长度为 K 的布尔数组（未选中的棋盘为 False）"""
+        boards = self._boards[mask]
+        rotation = self.rotation[mask] if rotation is None else rotation[mask]
+        cells = self._cells[self.shape_index[mask], rotation]
+        cell_x = cells[:, :, 0] + (self.x[mask] + dx)[:, None]
+        cell_y = cells[:, :, 1] + (self.y[mask] + dy)[:, None]
+
+        # 检查边界
+        in_bounds = (cell_x >= 0) & (cell_x < self.width) & (cell_y < self.height)
+
+        # 检查碰撞（网格上方的格子不检查）
+        occupied = self.grids[
+            boards[:, None],
+            np.clip(cell_y, 0, self.height - 1),
+            np.clip(cell_x, 0, self.width - 1)
+        ] != 0
+        collides = occupied & (cell_y >= 0)
+
+        valid = np.zeros(self.count, dtype=bool)
+        valid[mask] = (in_bounds & ~collides).all(axis=1)
+        return valid
+
+    def move_piece(self, dx: int, dy: int, mask=None):
+        """移动方块，返回各棋盘是否移动成功"""
+        mask = self._select(mask)
+        moved = self._is_valid_position(mask, dx, dy)
+        self.x[moved] += dx
+        self.y[moved] += dy
+        return moved
+
+    def rotate_piece(self, mask=None):
+        """旋转方块（含墙踢），返回各棋盘是否旋转成功"""
+        mask = self._select(mask)
+        rotation = (self.rotation + 1) % ROTATION_COUNT
+        rotated = self._is_valid_position(mask, 0, 0, rotation)
+
+        # 尝试墙踢（Wall Kick）
+        for kick_x, kick_y in WALL_KICKS:
+            pending = mask & ~rotated
+            if not pending.any():
+                break
+            kicked = self._is_valid_position(pending, kick_x, kick_y, rotation)
+            self.x[kicked] += kick_x
+            self.y[kicked] += kick_y
+            rotated |= kicked
+
+        self.rotation[rotated] = rotation[rotated]
+        return rotated
+
+    def hard_drop(self, mask=None):
+        """将方块下落到底，返回各棋盘下落的行数"""
+        mask = self._select(mask)
+        distance = np.zeros(self.count, dtype=np.int64)
+        falling = mask.copy()
+        while falling.any():
+            falling = self.move_piece(0, 1, falling)
+            distance += falling
+        return distance
+
+    def lock_piece(self, mask=None):
+        """锁定方块到游戏板并消行，返回各棋盘消除的行数"""
+        mask = self._select(mask)
+        boards = self._boards[mask]
+        cells = self._cells[self.shape_index[mask], self.rotation[mask]]
+        cell_x = cells[:, :, 0] + self.x[mask][:, None]
+        cell_y = cells[:, :, 1] + self.y[mask][:, None]
+        colors = np.broadcast_to((self.shape_index[mask] + 1)[:, None], cell_x.shape)  # 1-7表示不同颜色的方块
+
+        visible = cell_y >= 0
+        self.grids[
+            np.broadcast_to(boards[:, None], cell_x.shape)[visible],
+            cell_y[visible],
+            cell_x[visible]
+        ] = colors[visible]
+        return self.clear_lines(mask)
+
+    def clear_lines(self, mask=None):
+        """清除完整的行，返回各棋盘消除的行数"""
+        mask = self._select(mask)
+        full = (self.grids[mask] != 0).all(axis=2)
+        lines = np.zeros(self.count, dtype=np.int64)
+        lines[mask] = full.sum(axis=1)
+        if not lines.any():
+            return lines
+
+        # 稳定排序把满行移到顶部、其余行保持原有顺序，再把顶部清空
+        changed = lines > 0
+        full = full[lines[mask] > 0]
+        order = np.argsort(~full, axis=1, kind='stable')
+        grids = np.take_along_axis(self.grids[changed], order[:, :, None], axis=1)
+        grids[np.arange(self.height)[None, :] < lines[changed][:, None]] = 0
+        self.grids[changed] = grids
+        return lines
+
+    def get_game_state(self):
+        """获取所有棋盘的占用状态 (K, 高, 宽)，1 表示已占用"""
+        return (self.grids != 0).astype(np.uint8)
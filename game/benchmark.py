@@ -0,0 +1,186 @@
+"""
+无界面渲染基准
+
+使用 SDL 的 dummy 视频驱动把 GameEngine 渲染到离屏 Surface，按脚本输入驱动每个游戏状态，
+统计每个主题、每个状态的帧率与单帧渲染耗时，并对逐帧画面做哈希（黄金帧），
+用于证明渲染优化前后画面逐像素一致。哈希与本机字体有关，应在同一环境中比较。
+
+用法: python -m game.benchmark --frames 300 --golden golden_frames.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, Any, List
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from .constants import THEMES, SCREEN_WIDTH, SCREEN_HEIGHT
+from .engine import GameEngine
+from . import persistence
+
+BENCHMARK_STATES = [
+    'MENU', 'SETTINGS', 'HIGH_SCORES', 'STATISTICS', 'PLAYING', 'PAUSED', 'GAME_OVER', 'HIGH_SCORE_ENTRY'
+]
+
+# 各状态每帧的脚本按键（循环使用，None 表示该帧没有输入）
+SCRIPTS = {
+    'MENU': [pygame.K_DOWN, None, pygame.K_UP, None],
+    'SETTINGS': [pygame.K_DOWN, None, pygame.K_DOWN, None, pygame.K_UP, pygame.K_UP],
+    'HIGH_SCORES': [None],
+    'STATISTICS': [None],
+    'PLAYING': [pygame.K_LEFT, pygame.K_DOWN, pygame.K_UP, None, pygame.K_RIGHT, pygame.K_DOWN,
+                pygame.K_RIGHT, None, pygame.K_SPACE],
+    'PAUSED': [None],
+    'GAME_OVER': [None],
+    'HIGH_SCORE_ENTRY': [None]
+}
+
+
+def create_engine(data_dir: str, dirty_rendering: bool = False) -> GameEngine:
+    """创建渲染到离屏 Surface 的游戏引擎"""
+    pygame.init()
+    # convert() 等调用需要已设置的显示模式，dummy 驱动下不会创建真实窗口
+    pygame.display.set_mode((1, 1))
+    engine = GameEngine(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), data_dir)
+    engine.dirty_rendering = dirty_rendering
+    engine.board.dirty = [] if dirty_rendering else None
+    return engine
+
+
+def _press(engine: GameEngine, key: int) -> None:
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode='', mod=0, scancode=0))
+    engine.handle_events()
+
+
+def _start_game(engine: GameEngine) -> None:
+    engine.start_new_game()
+    # 不记录游戏时长，否则统计界面会随墙钟时间变化
+    engine.game_start_time = None
+
+
+def _enter_state(engine: GameEngine, state: str, seed: int) -> None:
+    """把引擎切换到指定状态（游戏类状态使用固定种子，保证画面可复现）"""
+    if state in ('PLAYING', 'PAUSED', 'GAME_OVER'):
+        random.seed(seed)
+        _start_game(engine)
+        if state == 'GAME_OVER':
+            while not engine.session.game_over:
+                engine.session.hard_drop()
+        if state != 'PLAYING':
+            engine.game_state = state
+    else:
+        engine.game_state = state
+
+
+def run_state(engine: GameEngine, state: str, frames: int, seed: int) -> Dict[str, Any]:
+    """按脚本渲染指定状态的若干帧，返回耗时统计与画面哈希"""
+    _enter_state(engine, state, seed)
+    script = SCRIPTS[state]
+    digest = hashlib.sha256()
+    times = []
+    for frame in range(frames):
+        key = script[frame % len(script)]
+        if key is not None:
+            _press(engine, key)
+        if state == 'PLAYING' and engine.game_state != 'PLAYING':
+            _start_game(engine)
+
+        start = time.perf_counter()
+        engine.render()
+        times.append(time.perf_counter() - start)
+        digest.update(pygame.image.tobytes(engine.screen, 'RGB'))
+
+    ordered = sorted(times)
+    total = sum(times)
+    return {
+        'frames': frames,
+        'fps': round(frames / total, 1) if total else 0,
+        'mean_ms': round(statistics.fmean(times) * 1000, 4),
+        'p50_ms': round(ordered[len(ordered) // 2] * 1000, 4),
+        'p99_ms': round(ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1000, 4),
+        'max_ms': round(ordered[-1] * 1000, 4),
+        'hash': digest.hexdigest()
+    }
+
+
+def run_benchmark(frames: int = 300, seed: int = 0, themes: List[str] = None,
+                  states: List[str] = None, dirty_rendering: bool = False) -> Dict[str, Any]:
+    """对每个主题与状态运行渲染基准，返回 {主题: {状态: 统计}}"""
+    results = {}
+    with tempfile.TemporaryDirectory() as data_dir:
+        engine = create_engine(data_dir, dirty_rendering)
+        for theme in themes or list(THEMES):
+            engine.settings_manager.set_setting('theme', theme)
+            engine._invalidate_render_caches()
+            results[theme] = {
+                state: run_state(engine, state, frames, seed)
+                for state in states or BENCHMARK_STATES
+            }
+        persistence.flush()
+        pygame.quit()
+    return results
+
+
+def compare_golden(results: Dict[str, Any], golden: Dict[str, Any]) -> List[str]:
+    """与黄金帧哈希比较，返回不一致的 "主题/状态" 列表"""
+    mismatches = []
+    for theme, states in results.items():
+        for state, result in states.items():
+            expected = golden.get(theme, {}).get(state)
+            if expected is not None and expected != result['hash']:
+                mismatches.append(f"{theme}/{state}")
+    return mismatches
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="Benchmark headless rendering per game state and theme")
+    parser.add_argument('--frames', type=int, default=300, help="frames rendered per state")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the piece sequence")
+    parser.add_argument('--theme', action='append', choices=list(THEMES), help="theme to run (repeatable)")
+    parser.add_argument('--state', action='append', choices=BENCHMARK_STATES, help="state to run (repeatable)")
+    parser.add_argument('--dirty', action='store_true', help="enable dirty-rectangle rendering")
+    parser.add_argument('--golden', default=None, help="golden frame hash file to check against")
+    parser.add_argument('--update-golden', action='store_true', help="write the hashes to --golden instead")
+    parser.add_argument('--output', default=None, help="write the results JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.frames, args.seed, args.theme, args.state, args.dirty)
+    for theme, states in results.items():
+        for state, result in states.items():
+            print(f"{theme:<8} {state:<17} {result['fps']:>10.1f} fps  "
+                  f"p50 {result['p50_ms']:.3f} ms  p99 {result['p99_ms']:.3f} ms  {result['hash'][:12]}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if not args.golden:
+        return 0
+    hashes = {theme: {state: r['hash'] for state, r in states.items()} for theme, states in results.items()}
+    if args.update_golden or not os.path.exists(args.golden):
+        with open(args.golden, 'w', encoding='utf-8') as f:
+            json.dump(hashes, f, ensure_ascii=False, indent=2)
+        print(f"golden frames written to {args.golden}")
+        return 0
+
+    with open(args.golden, 'r', encoding='utf-8') as f:
+        mismatches = compare_golden(results, json.load(f))
+    if mismatches:
+        print(f"golden frame mismatch: {', '.join(mismatches)}")
+        return 1
+    print("golden frames match")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,4 @@
-# 游戏常量配置
-import pygame
+# 游戏常量配置（不依赖 pygame，可在无界面环境中导入）
 
 # 屏幕设置
 SCREEN_WIDTH = 800
@@ -85,3 +84,57 @@ SCORE_RULES = {
     'SOFT_DROP': 1,
     'HARD_DROP': 2
 }
+
+# AI 落点评估权重（负值为惩罚项）
+AI_WEIGHTS = {
+    'aggregate_height': -0.510066,
+    'lines': 0.760666,
+    'holes': -0.35663,
+    'bumpiness': -0.184483
+}
+
+# 自动演示模式下每个操作之间的间隔（秒）
+AI_MOVE_INTERVAL = 0.05
+
+# 前瞻搜索：束宽度与每步时间预算（秒），预算需远小于一帧（1 / FPS）
+AI_BEAM_WIDTH = 8
+AI_TIME_BUDGET = 0.004
+
+# AI 置换表容量（缓存的局面展开数，按 LRU 淘汰）
+AI_TABLE_SIZE = 512
+
+# 文字渲染缓存容量（缓存的 Surface 数量）
+TEXT_CACHE_SIZE = 256
+
+# 各游戏状态的目标帧率：只有 PLAYING 按帧率持续刷新，其余状态阻塞等待事件，
+# 帧率仅决定无事件时的唤醒间隔
+STATE_FPS = {
+    'PLAYING': FPS,
+    'PAUSED': 5,
+    'GAME_OVER': 5,
+    'MENU': 10,
+    'SETTINGS': 10,
+    'HIGH_SCORES': 5,
+    'STATISTICS': 5,
+    'HIGH_SCORE_ENTRY': 10
+}
+
+# 窗口失去焦点或最小化时的帧率
+UNFOCUSED_FPS = 5
+
+# 固定步长逻辑：每个逻辑步的时长（秒），以及单帧最多追赶的时间（避免卡顿后连续掉落）
+LOGIC_TICK = 1 / 120
+MAX_FRAME_TIME = 0.25
+
+# 帧耗时分析：环形缓冲区保存的帧数，以及直方图的上限（毫秒，1 ms 一档）
+PROFILER_FRAMES = 600
+PROFILER_HISTOGRAM_MS = 50
+
+# 后台写入：等待写入的文件数上限（达到上限时保存调用才会等待）
+PERSISTENCE_QUEUE_SIZE = 16
+
+# 设置保存延迟（秒）：最后一次修改后经过该时间才写入 settings.json
+SETTINGS_SAVE_DELAY = 0.5
+
+# 统计快照：每追加多少局游戏记录就重写一次 statistics.json 快照（启动时只需回放快照之后的记录）
+STATS_SNAPSHOT_INTERVAL = 50
@@ -2,8 +2,18 @@ import pygame
 import sys
 import time
 import os
+import json
+import threading
+import math
+from contextlib import contextmanager
 from .constants import *
-from .tetris import GameBoard, Tetromino
+from .simulation import GameSession
+from .ai import BeamSearchBot
+from .text_cache import TextCache
+from .atlas import BlockAtlas, PREVIEW_SIZE
+from .profiler import FrameProfiler
+from . import persistence
+from .tetris import Tetromino
 from .highscore import HighScoreManager
 from .statistics import StatisticsManager
 from .settings import SettingsManager
@@ -20,38 +30,82 @@ from .i18n import (
 class GameEngine:
     """游戏引擎类"""
     
-    def __init__(self):
-        """初始化游戏引擎"""
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, screen=None, data_dir: str = "data", profile_path: str = None,
+                 profile_startup: bool = False):
+        """初始化游戏引擎（传入离屏 Surface 时渲染到该 Surface，不创建游戏窗口；
+        指定 profile_path 时退出前导出帧耗时数据；profile_startup 为 True 时打印启动耗时）"""
+        # 分阶段启动：窗口与字体就绪即可显示菜单，音频在后台线程加载，高分榜与统计数据
+        # 在首帧之后于后台预加载（或在首次访问时加载）
+        self.startup_start = time.perf_counter()
+        self.startup_timings = []
+        self.profile_startup = profile_startup
+        self.data_dir = data_dir
+        
+        with self._startup_stage('pygame init'):
+            # 只初始化显示与字体模块，混音器由 SoundManager 在后台初始化
+            pygame.display.init()
+            pygame.font.init()
+        with self._startup_stage('window'):
+            self.screen = screen if screen is not None else pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.font = self._load_font(30)
-        self.small_font = self._load_font(20)
-        self.tiny_font = self._load_font(16)
-        
-        # 数据管理器
-        self.high_score_manager = HighScoreManager()
-        self.stats_manager = StatisticsManager()
-        self.settings_manager = SettingsManager()
-        self.sound_manager = SoundManager(self.base_dir, self.settings_manager)
+        with self._startup_stage('fonts'):
+            self.font_cache_file = os.path.join(data_dir, 'font_cache.json')
+            self.font_path = self._resolve_font_path()
+            self.font = self._load_font(30)
+            self.small_font = self._load_font(20)
+            self.tiny_font = self._load_font(16)
+        self.text_cache = TextCache()
+        
+        # 数据管理器（高分榜与统计数据按需加载）
+        self._manager_lock = threading.Lock()
+        self._high_score_manager = None
+        self._stats_manager = None
+        with self._startup_stage('settings'):
+            self.settings_manager = SettingsManager(data_dir)
+        self.sound_manager = SoundManager(self.base_dir, self.settings_manager, load_async=True)
         self.theme = THEMES.get(self.settings_manager.get_setting('theme', 'CLASSIC'), THEMES['CLASSIC'])
+        self.atlas = None
         self.language = self.settings_manager.get_setting('language', 'zh')
         pygame.display.set_caption(t(self.language, "app.title"))
         
-        # 游戏状态
-        self.board = GameBoard()
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.game_over = False
+        # 游戏画面分层缓存：静态背景（主题/语言变化时重建）与已锁定方块（棋盘变化时重建）
+        self.static_layer = None
+        self.locked_layer = None
+        self.locked_layer_version = None
+        
+        # 游戏状态（棋盘、分数、等级与重力由无界面的 GameSession 负责）
         self.paused = False
         self.difficulty = self.settings_manager.get_setting('difficulty', 'MEDIUM')
+        self.session = GameSession(self.difficulty)
+        
+        # 自动演示与落点提示（AI 前瞻搜索，每个方块只搜索一次）
+        self.bot = BeamSearchBot()
+        self.autoplay = False
+        self.autoplay_used = False  # 本局是否用过自动演示（这样的局不计入统计与高分榜）
+        self.show_hint = False
+        self.bot_piece = None
+        self.bot_target = None
+        self.hint_piece = None
+        self.last_autoplay_time = 0
         
-        # 时间控制
-        self.fall_time = 0
-        self.fall_speed = DIFFICULTY_SETTINGS[self.difficulty]['fall_speed']
-        self.last_fall_time = time.time()
+        # 局部重绘：只提交发生变化的区域，画面不变的帧不做任何绘制
+        self.dirty_rendering = self.settings_manager.get_setting('dirty_rendering', False)
+        self.full_redraw = True
+        self.rendered_state = None
+        self.sidebar_fields = {}
+        if self.dirty_rendering:
+            self.board.dirty = []
+        
+        # 暂停与游戏结束时画面静止：进入时合成一次游戏画面与覆盖层，之后直接贴图
+        self.frozen_frame = None
+        
+        # 时间控制：逻辑以 LOGIC_TICK 为固定步长推进，与渲染帧率无关
+        self.last_update_time = time.perf_counter()
+        self.logic_accumulator = 0.0
+        self.logic_clock = 0.0
+        self.logic_ticks = 0
+        self.logic_time = 0.0
         self.game_start_time = None
         self.current_session_time = 0
         
@@ -78,9 +132,86 @@ class GameEngine:
         # 输入状态
         self.entering_name = False
         self.player_name = ""
+        self.last_game = None
+        self.high_scores_page = 0
         
-        # 初始化游戏
-        self.board.create_new_piece()
+        # 帧调度：窗口是否处于前台，以及空闲等待期间收到、留给下一帧处理的事件
+        self.window_active = True
+        self.pending_event = None
+        
+        # 帧耗时分析（F3 切换显示）
+        self.profiler = FrameProfiler()
+        self.profile_path = profile_path
+        self.profiler_hud_lines = []
+        self.profiler_hud_time = 0
+        self.profiler_hud_rect = pygame.Rect(SCREEN_WIDTH - 210, 0, 210, 114)
+
+
+    @contextmanager
+    def _startup_stage(self, name):
+        """记录一个启动阶段的耗时"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings.append((name, time.perf_counter() - start))
+
+    @property
+    def high_score_manager(self):
+        with self._manager_lock:
+            if self._high_score_manager is None:
+                with self._startup_stage('high scores'):
+                    self._high_score_manager = HighScoreManager(self.data_dir)
+            return self._high_score_manager
+
+    @property
+    def stats_manager(self):
+        with self._manager_lock:
+            if self._stats_manager is None:
+                with self._startup_stage('statistics'):
+                    self._stats_manager = StatisticsManager(self.data_dir)
+            return self._stats_manager
+
+    def _preload(self):
+        """首帧之后在后台预加载高分榜与统计数据"""
+        # 访问属性即触发加载
+        self.high_score_manager
+        self.stats_manager
+        if self.profile_startup:
+            self.sound_manager.loaded.wait()
+            if self.sound_manager.load_time is not None:
+                self.startup_timings.append(('sound (background)', self.sound_manager.load_time))
+            self._print_startup_profile()
+
+    def _print_startup_profile(self):
+        """打印启动耗时"""
+        print("启动耗时:")
+        for name, seconds in self.startup_timings:
+            print(f"  {name:<20}{seconds * 1000:9.1f} ms")
+
+    @property
+    def board(self):
+        return self.session.board
+
+    @property
+    def score(self):
+        return self.session.score
+
+    @property
+    def level(self):
+        return self.session.level
+
+    @property
+    def lines_cleared(self):
+        return self.session.lines_cleared
+
+    @property
+    def game_over(self):
+        return self.session.game_over
+
+    @property
+    def fall_speed(self):
+        return self.session.fall_speed
 
     def _t(self, key: str, **kwargs) -> str:
         return t(self.language, key, **kwargs)
@@ -101,12 +232,38 @@ class GameEngine:
         pygame.display.set_caption(self._t('app.title'))
         self._update_menu_items()
         self._update_settings_menu()
+        self._invalidate_render_caches()
+
+    def _invalidate_render_caches(self) -> None:
+        """语言或主题切换后清空渲染缓存"""
+        self.text_cache.clear()
+        self.static_layer = None
+        self.locked_layer = None
         
     def handle_events(self):
         """处理游戏事件"""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.pending_event:
+            events.insert(0, self.pending_event)
+            self.pending_event = None
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
+            
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.hud_visible = not self.profiler.hud_visible
+                self.full_redraw = True
+                continue
+            
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED):
+                self.window_active = False
+            elif event.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED):
+                self.window_active = True
+            
+            # 窗口被覆盖后恢复，或菜单类界面收到按键时整屏重绘
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) or (
+                    event.type == pygame.KEYDOWN and self.game_state != 'PLAYING'):
+                self.full_redraw = True
                 
             if event.type == pygame.KEYDOWN:
                 if self.game_state == 'MENU':
@@ -119,7 +276,9 @@ class GameEngine:
                     self._handle_game_over_input(event.key)
                 elif self.game_state == 'HIGH_SCORE_ENTRY':
                     self._handle_high_score_entry_input(event.key, event)
-                elif self.game_state in ['HIGH_SCORES', 'STATISTICS']:
+                elif self.game_state == 'HIGH_SCORES':
+                    self._handle_high_scores_input(event.key)
+                elif self.game_state == 'STATISTICS':
                     if event.key == pygame.K_ESCAPE:
                         self.game_state = 'MENU'
                 elif self.game_state == 'SETTINGS':
@@ -127,17 +286,35 @@ class GameEngine:
                         
         return True
     
-    def _handle_high_score_entry_input(self, key, event):
-        """处理高分输入"""
-        if key == pygame.K_RETURN and self.player_name.strip():
-            # 保存高分
+    def _save_player_name(self):
+        """把输入的玩家名写入刚结束的这局游戏"""
+        default_name = self._t('default_player_name')
+        if self.last_game is not None:
+            self.high_score_manager.set_player_name(self.last_game, self.player_name, default_name)
+        else:
             self.high_score_manager.add_score(
                 self.player_name,
                 int(self.score),
                 self.level,
                 self.lines_cleared,
-                default_name=self._t('default_player_name')
+                default_name=default_name,
+                difficulty=self.session.difficulty
             )
+    
+    def _handle_high_scores_input(self, key):
+        """处理高分榜输入（左右键翻页）"""
+        if key == pygame.K_ESCAPE:
+            self.game_state = 'MENU'
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT):
+            direction = -1 if key == pygame.K_LEFT else 1
+            pages = self.high_score_manager.get_page_count()
+            self.high_scores_page = max(0, min(pages - 1, self.high_scores_page + direction))
+    
+    def _handle_high_score_entry_input(self, key, event):
+        """处理高分输入"""
+        if key == pygame.K_RETURN and self.player_name.strip():
+            # 保存高分
+            self._save_player_name()
             self.player_name = ""
             self.entering_name = False
             self.game_state = 'MENU'
@@ -157,13 +334,7 @@ class GameEngine:
             # 输入玩家姓名
             if key == pygame.K_RETURN and self.player_name.strip():
                 # 保存高分
-                self.high_score_manager.add_score(
-                    self.player_name,
-                    int(self.score),
-                    self.level,
-                    self.lines_cleared,
-                    default_name=self._t('default_player_name')
-                )
+                self._save_player_name()
                 self.player_name = ""
                 self.entering_name = False
                 self.game_state = 'MENU'
@@ -189,24 +360,28 @@ class GameEngine:
     def _handle_game_input(self, key):
         """处理游戏输入"""
         if key == pygame.K_LEFT:
-            if self.board.move_piece(-1, 0):
+            if self.session.move(-1):
                 self.sound_manager.play_sound('move')
         elif key == pygame.K_RIGHT:
-            if self.board.move_piece(1, 0):
+            if self.session.move(1):
                 self.sound_manager.play_sound('move')
         elif key == pygame.K_DOWN:
-            if self.board.move_piece(0, 1):
-                self.score += SCORE_RULES['SOFT_DROP']
+            if self.session.soft_drop():
                 self.sound_manager.play_sound('move')
         elif key == pygame.K_UP:
-            if self.board.rotate_piece():
+            if self.session.rotate():
                 self.sound_manager.play_sound('rotate')
         elif key == pygame.K_SPACE:
             # 硬降
-            while self.board.move_piece(0, 1):
-                self.score += SCORE_RULES['HARD_DROP']
             self.sound_manager.play_sound('drop')
-            self._lock_current_piece()
+            self._after_piece_locked(self.session.hard_drop())
+        elif key == pygame.K_a:
+            self.autoplay = not self.autoplay
+            self.autoplay_used = self.autoplay_used or self.autoplay
+            self.bot_piece = None
+        elif key == pygame.K_h:
+            self.show_hint = not self.show_hint
+            self.bot_piece = None
         elif key == pygame.K_p:
             self.game_state = 'PAUSED'
         elif key == pygame.K_ESCAPE:
@@ -223,7 +398,7 @@ class GameEngine:
         """处理游戏结束输入"""
         if key == pygame.K_SPACE:
             # 检查是否为高分
-            if self.high_score_manager.is_high_score(int(self.score)):
+            if not self.autoplay_used and self.high_score_manager.is_high_score(int(self.score)):
                 self.entering_name = True
                 self.player_name = ""
                 self.game_state = 'HIGH_SCORE_ENTRY'
@@ -239,6 +414,7 @@ class GameEngine:
         if item_key == 'menu.start':
             self.start_new_game()
         elif item_key == 'menu.high_scores':
+            self.high_scores_page = 0
             self.game_state = 'HIGH_SCORES'
         elif item_key == 'menu.statistics':
             self.game_state = 'STATISTICS'
@@ -246,66 +422,124 @@ class GameEngine:
             self.game_state = 'SETTINGS'
             self._update_settings_menu()
         elif item_key == 'menu.exit':
-            pygame.quit()
-            sys.exit()
+            self._shutdown()
             
     def update(self):
-        """更新游戏状态"""
+        """更新游戏状态：按经过的时间执行若干个固定步长的逻辑步"""
+        current_time = time.perf_counter()
+        frame_time = min(current_time - self.last_update_time, MAX_FRAME_TIME)
+        self.last_update_time = current_time
+        self.logic_ticks = 0
+        self.settings_manager.save_if_idle()
         if self.game_state != 'PLAYING':
+            self.logic_time = 0.0
             return
-            
-        current_time = time.time()
+        
+        self.logic_accumulator += frame_time
+        while self.logic_accumulator >= LOGIC_TICK and self.game_state == 'PLAYING':
+            self._logic_tick()
+            self.logic_accumulator -= LOGIC_TICK
+            self.logic_ticks += 1
+        self.logic_time = time.perf_counter() - current_time
+    
+    def _logic_tick(self):
+        """执行一个固定步长的逻辑步"""
+        self.logic_clock += LOGIC_TICK
+        
+        if self.autoplay or self.show_hint:
+            self._refresh_bot_target()
+        if self.autoplay:
+            self._update_autoplay(self.logic_clock)
+            if self.game_state != 'PLAYING':
+                return
         
         # 方块自动下落
-        if current_time - self.last_fall_time > self.fall_speed:
-            if not self.board.move_piece(0, 1):
-                self._lock_current_piece()
-            self.last_fall_time = current_time
+        lines_cleared = self.session.update(LOGIC_TICK)
+        if lines_cleared is not None:
+            self._after_piece_locked(lines_cleared)
+    
+    def _fall_offset(self):
+        """插值显示：当前方块在两次下落之间已经下降的像素数（未开启插值时为 0）"""
+        if not self.settings_manager.get_setting('interpolate_fall', False) or self.board.ghost_distance <= 0:
+            return 0
+        progress = (self.session.fall_timer + self.logic_accumulator) / self.session.fall_speed
+        return int(GRID_SIZE * min(progress, 1))
             
-    def _lock_current_piece(self):
-        """锁定当前方块"""
-        lines_cleared = self.board.lock_piece()
+    def _refresh_bot_target(self):
+        """当前方块变化时重新搜索 AI 落点"""
+        piece = self.board.current_piece
+        if piece is None or self.bot_piece is piece:
+            return
+        self.bot_piece = piece
+        self.bot_target = self.bot.best_placement(self.board)
+        self.hint_piece = None
+        if self.bot_target:
+            hint = Tetromino(piece.shape_index)
+            hint.rotation, hint.x = self.bot_target
+            hint.y = self.board.drop_distance(hint)
+            self.hint_piece = hint
+    
+    def _update_autoplay(self, current_time):
+        """自动演示：按固定间隔向 AI 选出的落点执行一次操作"""
+        piece = self.board.current_piece
+        if not piece or current_time - self.last_autoplay_time < AI_MOVE_INTERVAL:
+            return
+        self.last_autoplay_time = current_time
+        
+        if self.bot_target is None:
+            self._handle_game_input(pygame.K_SPACE)
+            return
         
+        rotation, x = self.bot_target
+        if piece.rotation != rotation:
+            previous_rotation = piece.rotation
+            self._handle_game_input(pygame.K_UP)
+            if piece.rotation == previous_rotation:
+                # 旋转受阻，保持当前方向
+                self.bot_target = (piece.rotation, x)
+        elif piece.x != x:
+            previous_x = piece.x
+            self._handle_game_input(pygame.K_LEFT if piece.x > x else pygame.K_RIGHT)
+            if piece.x == previous_x:
+                # 平移受阻，就地落下
+                self.bot_target = (rotation, piece.x)
+        else:
+            self._handle_game_input(pygame.K_SPACE)
+            
+    def _after_piece_locked(self, lines_cleared):
+        """方块锁定后的音效与游戏结束处理"""
         if lines_cleared > 0:
-            self._calculate_score(lines_cleared)
-            self.lines_cleared += lines_cleared
             self.sound_manager.play_sound('line')
-            
-            # 更新等级
-            self.level = self.lines_cleared // 10 + 1
-            self._update_fall_speed()
         
-        # 创建新方块
-        if not self.board.create_new_piece():
-            self.game_over = True
+        if self.session.game_over:
             self.game_state = 'GAME_OVER'
             self.sound_manager.play_sound('game_over')
             
-            # 记录游戏统计
-            if self.game_start_time:
+            # 记录游戏统计（用过自动演示的局不记录）
+            if self.game_start_time and not self.autoplay_used:
                 session_time = time.time() - self.game_start_time
                 self.stats_manager.record_game(
-                    int(self.score), self.level, self.lines_cleared, self.difficulty
+                    int(self.score), self.level, self.lines_cleared, self.session.difficulty,
+                    duration=session_time, pieces=self.session.pieces_placed
                 )
-                self.stats_manager.end_session(session_time)
-                self.game_start_time = None
-            
-    def _calculate_score(self, lines_cleared):
-        """计算得分"""
-        score_multiplier = DIFFICULTY_SETTINGS[self.difficulty]['score_multiplier']
-        
-        if lines_cleared == 1:
-            self.score += SCORE_RULES['SINGLE'] * self.level * score_multiplier
-        elif lines_cleared == 2:
-            self.score += SCORE_RULES['DOUBLE'] * self.level * score_multiplier
-        elif lines_cleared == 3:
-            self.score += SCORE_RULES['TRIPLE'] * self.level * score_multiplier
-        elif lines_cleared == 4:
-            self.score += SCORE_RULES['TETRIS'] * self.level * score_multiplier
+                self.last_game = self.high_score_manager.record_game(
+                    int(self.score), self.level, self.lines_cleared, self.session.difficulty,
+                    name=self._t('default_player_name')
+                )
+            self.game_start_time = None
 
     def _load_font(self, size):
-        """加载支持中文的字体"""
-        # 优先加载项目内字体文件
+        """按已解析的字体路径加载指定字号的字体"""
+        if self.font_path:
+            try:
+                return pygame.font.Font(self.font_path, size)
+            except (pygame.error, OSError):
+                pass
+        return pygame.font.Font(None, size)
+    
+    def _resolve_font_path(self):
+        """查找支持中文的字体文件，系统字体的查找结果缓存在 data 目录中"""
+        # 优先使用项目内字体文件
         fonts_dir = os.path.join(self.base_dir, 'assets', 'fonts')
         font_candidates = [
             os.path.join(fonts_dir, 'NotoSansSC-Regular.ttf'),
@@ -314,12 +548,20 @@ class GameEngine:
         ]
         for path in font_candidates:
             if os.path.exists(path):
-                try:
-                    return pygame.font.Font(path, size)
-                except pygame.error:
-                    pass
+                return path
+
+        # 系统字体回退：match_font 需要扫描系统字体注册表，结果按系统字体目录的修改时间缓存
+        cache_key = self._font_cache_key()
+        try:
+            if os.path.exists(self.font_cache_file):
+                with open(self.font_cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                path = cache.get('path')
+                if cache.get('key') == cache_key and (path is None or os.path.exists(path)):
+                    return path
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"加载字体缓存失败: {e}")
 
-        # 系统字体回退
         system_fonts = [
             'Microsoft YaHei',
             'Microsoft YaHei UI',
@@ -328,17 +570,51 @@ class GameEngine:
             'PingFang SC',
             'WenQuanYi Zen Hei'
         ]
+        path = None
         for name in system_fonts:
-            if pygame.font.match_font(name):
-                return pygame.font.SysFont(name, size)
+            path = pygame.font.match_font(name)
+            if path:
+                break
 
-        return pygame.font.Font(None, size)
+        try:
+            os.makedirs(os.path.dirname(self.font_cache_file) or '.', exist_ok=True)
+            with open(self.font_cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'key': cache_key, 'path': path}, f, ensure_ascii=False, indent=2)
+        except IOError as e:
+            print(f"保存字体缓存失败: {e}")
+        return path
     
-    def _update_fall_speed(self):
-        """更新下落速度"""
-        base_speed = DIFFICULTY_SETTINGS[self.difficulty]['fall_speed']
-        speed_increase = 0.05 * (self.level - 1)
-        self.fall_speed = max(base_speed - speed_increase, 0.05)
+    @staticmethod
+    def _font_cache_key():
+        """系统字体目录及其直接子目录的修改时间
+
+        Linux / macOS 上字体通常装在子目录中（如 ``/usr/share/fonts/truetype/<包名>``），
+        新建或删除这样的包目录只会改变其上一级目录的修改时间，因此子目录也要计入。
+        """
+        font_dirs = [
+            os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+            os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'),
+            '/System/Library/Fonts',
+            '/Library/Fonts',
+            os.path.expanduser('~/Library/Fonts'),
+            '/usr/share/fonts',
+            '/usr/local/share/fonts',
+            os.path.expanduser('~/.local/share/fonts'),
+            os.path.expanduser('~/.fonts')
+        ]
+        key = {}
+        for font_dir in font_dirs:
+            if not os.path.isdir(font_dir):
+                continue
+            key[font_dir] = os.path.getmtime(font_dir)
+            try:
+                with os.scandir(font_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            key[entry.path] = entry.stat().st_mtime
+            except OSError:
+                pass
+        return key
     
     def start_new_game(self):
         """开始新游戏"""
@@ -346,17 +622,17 @@ class GameEngine:
             session_time = time.time() - self.game_start_time
             self.stats_manager.end_session(session_time)
         
-        self.board.reset()
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.game_over = False
+        self.session.reset(self.difficulty)
         self.paused = False
-        self.fall_speed = DIFFICULTY_SETTINGS[self.difficulty]['fall_speed']
         self.game_state = 'PLAYING'
         self.game_start_time = time.time()
+        self.last_game = None
+        self.autoplay = False
+        self.autoplay_used = False
+        self.bot_piece = None
+        self.last_update_time = time.perf_counter()
+        self.logic_accumulator = 0.0
         self.stats_manager.start_session()
-        self.board.create_new_piece()
         self.sound_manager.update_settings()
         self.sound_manager.play_music()
     
@@ -371,7 +647,12 @@ class GameEngine:
         elif key in (pygame.K_LEFT, pygame.K_RIGHT):
             self._adjust_setting(key)
         elif key == pygame.K_ESCAPE:
-            self.game_state = 'MENU'
+            self._leave_settings()
+    
+    def _leave_settings(self):
+        """离开设置界面并保存未写入的设置"""
+        self.settings_manager.flush()
+        self.game_state = 'MENU'
     
     def _execute_settings_item(self):
         """执行设置项"""
@@ -399,6 +680,7 @@ class GameEngine:
             next_index = (current_index + 1) % len(themes)
             self.settings_manager.set_setting('theme', themes[next_index])
             self.theme = THEMES.get(themes[next_index], THEMES['CLASSIC'])
+            self._invalidate_render_caches()
         elif entry_id == 'language':
             self._cycle_language(1)
         elif entry_id == 'reset':
@@ -408,8 +690,9 @@ class GameEngine:
             self.language = self.settings_manager.get_setting('language', 'zh')
             pygame.display.set_caption(self._t('app.title'))
             self._update_menu_items()
+            self._invalidate_render_caches()
         elif entry_id == 'back':
-            self.game_state = 'MENU'
+            self._leave_settings()
 
         if entry_id != 'back':
             self._update_settings_menu()
@@ -437,6 +720,7 @@ class GameEngine:
             current_index = (current_index + direction) % len(themes)
             self.settings_manager.set_setting('theme', themes[current_index])
             self.theme = THEMES.get(themes[current_index], THEMES['CLASSIC'])
+            self._invalidate_render_caches()
         elif entry_id == 'language':
             self._cycle_language(direction)
         elif entry_id in ['sound', 'music', 'ghost']:
@@ -491,19 +775,35 @@ class GameEngine:
     
     def render(self):
         """渲染游戏画面"""
-        self.theme = THEMES.get(self.settings_manager.get_setting('theme', 'CLASSIC'), THEMES['CLASSIC'])
-        self.screen.fill(self.theme['background'])
+        hud_changed = self.profiler.hud_visible and self._refresh_profiler_hud()
+        if self.dirty_rendering:
+            self._render_dirty(hud_changed)
+            return
+        if (self.game_state in ('PAUSED', 'GAME_OVER') and self.game_state == self.rendered_state
+                and not self.full_redraw and not hud_changed):
+            # 画面已冻结且已经显示，无需重绘
+            return
+        self.rendered_state = self.game_state
+        self.full_redraw = False
+        self._draw_frame()
+        pygame.display.flip()
+    
+    def _draw_frame(self):
+        """绘制整帧画面（不提交到显示器）"""
+        theme_name = self.settings_manager.get_setting('theme', 'CLASSIC')
+        self.theme = THEMES.get(theme_name, THEMES['CLASSIC'])
+        if self.atlas is None or self.atlas.theme_name != theme_name:
+            self.atlas = BlockAtlas(theme_name, self.base_dir)
+        if self.game_state not in ('PLAYING', 'PAUSED', 'GAME_OVER'):
+            # 游戏画面由分层缓存覆盖整屏，无需先清屏
+            self.screen.fill(self.theme['background'])
         
         if self.game_state == 'MENU':
             self._render_menu()
         elif self.game_state == 'PLAYING':
             self._render_game()
-        elif self.game_state == 'PAUSED':
-            self._render_game()
-            self._render_pause_overlay()
-        elif self.game_state == 'GAME_OVER':
-            self._render_game()
-            self._render_game_over_overlay()
+        elif self.game_state in ('PAUSED', 'GAME_OVER'):
+            self._render_frozen_frame()
         elif self.game_state == 'HIGH_SCORES':
             self._render_high_scores()
         elif self.game_state == 'STATISTICS':
@@ -513,17 +813,108 @@ class GameEngine:
         elif self.game_state == 'SETTINGS':
             self._render_settings()
         
-        pygame.display.flip()
+        if self.game_state not in ('PAUSED', 'GAME_OVER'):
+            self.frozen_frame = None
+        
+        if self.profiler.hud_visible:
+            self._render_profiler_hud()
+    
+    def _render_frozen_frame(self):
+        """渲染暂停/游戏结束画面（游戏画面与覆盖层只合成一次）"""
+        if self.frozen_frame is None or self.frozen_frame[0] != self.game_state:
+            self._render_game()
+            if self.game_state == 'PAUSED':
+                self._render_pause_overlay()
+            else:
+                self._render_game_over_overlay()
+            self.frozen_frame = (self.game_state, self.screen.copy())
+            return
+        self.screen.blit(self.frozen_frame[1], (0, 0))
+    
+    def _render_dirty(self, hud_changed=False):
+        """局部重绘：只重画并提交发生变化的区域"""
+        if self.game_state != self.rendered_state:
+            self.rendered_state = self.game_state
+            self.full_redraw = True
+        
+        rects = self._collect_dirty_rects()
+        if self.full_redraw:
+            self.full_redraw = False
+            self._draw_frame()
+            pygame.display.flip()
+            return
+        if hud_changed:
+            rects.append(self.profiler_hud_rect)
+        if not rects:
+            return
+        
+        for rect in rects:
+            self.screen.set_clip(rect)
+            self._draw_frame()
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+    
+    def _collect_dirty_rects(self):
+        """收集游戏板与侧边栏中发生变化的区域，按区域各合并为一个矩形"""
+        board_rects = [
+            pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, width * GRID_SIZE, height * GRID_SIZE)
+            for x, y, width, height in self.board.dirty
+        ]
+        self.board.dirty.clear()
+        
+        sidebar_x = GRID_WIDTH * GRID_SIZE + 20
+        hint = None
+        hint_rect = None
+        if self.show_hint and self.hint_piece and self.bot_piece is self.board.current_piece:
+            hint = tuple(self.hint_piece.get_shape_positions())
+            hint_rect = pygame.Rect(
+                self.hint_piece.x * GRID_SIZE, self.hint_piece.y * GRID_SIZE,
+                self.hint_piece.width * GRID_SIZE, self.hint_piece.height * GRID_SIZE
+            )
+        piece = self.board.current_piece
+        fall = None
+        fall_rect = None
+        if piece:
+            fall = (piece.x, piece.y, piece.rotation, self._fall_offset())
+            fall_rect = pygame.Rect(piece.x * GRID_SIZE, piece.y * GRID_SIZE,
+                                    piece.width * GRID_SIZE, (piece.height + 1) * GRID_SIZE)
+        next_piece = self.board.next_piece
+        fields = {
+            'next': (next_piece.shape_index if next_piece else None, pygame.Rect(sidebar_x, 60, 80, 40)),
+            'score': (int(self.score), pygame.Rect(sidebar_x, 150, SCREEN_WIDTH - sidebar_x, 30)),
+            'level': (self.level, pygame.Rect(sidebar_x, 180, SCREEN_WIDTH - sidebar_x, 30)),
+            'lines': (self.lines_cleared, pygame.Rect(sidebar_x, 210, SCREEN_WIDTH - sidebar_x, 30)),
+            'difficulty': (self.difficulty, pygame.Rect(sidebar_x, 240, SCREEN_WIDTH - sidebar_x, 30)),
+            'autoplay': (self.autoplay, pygame.Rect(sidebar_x, 270, SCREEN_WIDTH - sidebar_x, 30)),
+            'hint': (hint, hint_rect),
+            'fall': (fall, fall_rect)
+        }
+        sidebar_rects = []
+        for key, (value, rect) in fields.items():
+            previous = self.sidebar_fields.get(key)
+            if previous is not None and previous[0] == value:
+                continue
+            target = board_rects if key in ('hint', 'fall') else sidebar_rects
+            for changed in (previous[1] if previous else None, rect):
+                if changed:
+                    target.append(changed)
+        self.sidebar_fields = fields
+        
+        screen_rect = self.screen.get_rect()
+        return [
+            rects[0].unionall(rects[1:]).clip(screen_rect)
+            for rects in (board_rects, sidebar_rects) if rects
+        ]
     
     def _render_menu(self):
         """渲染菜单"""
-        title = self.font.render(self._t('menu.title'), True, COLORS['WHITE'])
+        title = self.text_cache.render(self.font, self._t('menu.title'), True, COLORS['WHITE'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
         
         for i, item in enumerate(self.menu_items):
             color = COLORS['YELLOW'] if i == self.menu_index else COLORS['WHITE']
-            text = self.small_font.render(item, True, color)
+            text = self.text_cache.render(self.small_font, item, True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 40))
             self.screen.blit(text, text_rect)
         
@@ -533,44 +924,90 @@ class GameEngine:
             self._t('menu.hint.esc')
         ]
         for i, control in enumerate(controls):
-            text = self.tiny_font.render(control, True, COLORS['LIGHT_GRAY'])
+            text = self.text_cache.render(self.tiny_font, control, True, COLORS['LIGHT_GRAY'])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 450 + i * 20))
             self.screen.blit(text, text_rect)
     
     def _render_game(self):
-        """渲染游戏画面"""
-        self._render_board()
+        """渲染游戏画面（静态背景层 + 已锁定方块层 + 每帧绘制的活动内容）"""
+        with self.profiler.phase('render.layers'):
+            self._update_layers()
+            board_width = GRID_WIDTH * GRID_SIZE
+            self.screen.blit(self.static_layer, (board_width, 0),
+                             (board_width, 0, SCREEN_WIDTH - board_width, SCREEN_HEIGHT))
+            self.screen.blit(self.locked_layer, (0, 0))
         
-        if self.board.current_piece:
-            self._render_piece(self.board.current_piece)
+        with self.profiler.phase('render.pieces'):
+            if self.board.current_piece:
+                self._render_piece(self.board.current_piece, self._fall_offset())
+            
+            if self.board.ghost_piece and self.settings_manager.get_setting('show_ghost_piece', True):
+                self._render_ghost_piece()
+            
+            if self.show_hint and self.hint_piece and self.bot_piece is self.board.current_piece:
+                self._render_hint_piece()
         
-        if self.board.ghost_piece and self.settings_manager.get_setting('show_ghost_piece', True):
-            self._render_ghost_piece()
+        with self.profiler.phase('render.sidebar'):
+            self._render_sidebar()
+    
+    def _update_layers(self):
+        """按需重建静态背景层与已锁定方块层"""
+        if self.static_layer is None:
+            self.static_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            self._render_static_layer(self.static_layer)
+            self.locked_layer = None
         
-        self._render_sidebar()
+        if self.locked_layer is None or self.locked_layer_version != self.board.version:
+            board_rect = pygame.Rect(0, 0, GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE)
+            self.locked_layer = self.static_layer.subsurface(board_rect).copy()
+            self._render_board(self.locked_layer)
+            self.locked_layer_version = self.board.version
     
-    def _render_board(self):
-        """渲染游戏板"""
-        pygame.draw.rect(self.screen, self.theme['border'],
+    def _render_static_layer(self, surface):
+        """渲染游戏中不变的内容：背景、边框、预览标题与操作说明"""
+        surface.fill(self.theme['background'])
+        pygame.draw.rect(surface, self.theme['border'],
                          (0, 0, GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE), 2)
         
+        sidebar_x = GRID_WIDTH * GRID_SIZE + 20
+        next_text = self.text_cache.render(self.small_font, self._t('sidebar.next'), True, COLORS['WHITE'])
+        surface.blit(next_text, (sidebar_x, 20))
+        
+        controls_y = 320
+        controls = [
+            self._t('sidebar.controls'),
+            self._t('controls.left_right'),
+            self._t('controls.rotate'),
+            self._t('controls.soft_drop'),
+            self._t('controls.hard_drop'),
+            self._t('controls.pause'),
+            self._t('controls.autoplay'),
+            self._t('controls.hint'),
+            self._t('controls.menu')
+        ]
+        for i, text in enumerate(controls):
+            control_text = self.text_cache.render(self.small_font, text, True, COLORS['LIGHT_GRAY'])
+            surface.blit(control_text, (sidebar_x, controls_y + i * 25))
+    
+    def _render_board(self, surface):
+        """渲染游戏板上已锁定的方块"""
+        atlas = self.atlas.surface
+        areas = self.atlas.areas
+        sprites = []
         for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.board.grid[y][x] > 0:
-                    color_index = self.board.grid[y][x] - 1
-                    color = PIECE_COLORS[color_index]
-                    pygame.draw.rect(self.screen, color,
-                                     (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE - 1, GRID_SIZE - 1))
-    
-    def _render_piece(self, piece):
-        """渲染方块"""
-        for y, row in enumerate(piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    pygame.draw.rect(self.screen, piece.color,
-                                     ((piece.x + x) * GRID_SIZE,
-                                      (piece.y + y) * GRID_SIZE,
-                                      GRID_SIZE - 1, GRID_SIZE - 1))
+            if not self.board.rows[y]:
+                continue
+            for x, color in enumerate(self.board.grid[y]):
+                if color > 0:
+                    sprites.append((atlas, (x * GRID_SIZE, y * GRID_SIZE), areas[('block', color - 1)]))
+        surface.blits(sprites, doreturn=False)
+    
+    def _render_piece(self, piece, offset_y=0):
+        """渲染方块（offset_y 为插值显示的像素偏移）"""
+        self.screen.blits(self.atlas.sprites(
+            ('block', piece.shape_index),
+            [(x * GRID_SIZE, y * GRID_SIZE + offset_y) for x, y in piece.get_shape_positions()]
+        ), doreturn=False)
     
     def _render_ghost_piece(self):
         """渲染幽灵方块"""
@@ -578,63 +1015,82 @@ class GameEngine:
         if not ghost:
             return
         
-        for y, row in enumerate(ghost.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    pygame.draw.rect(self.screen, self.theme['ghost'],
-                                     ((ghost.x + x) * GRID_SIZE,
-                                      (ghost.y + y) * GRID_SIZE,
-                                      GRID_SIZE - 1, GRID_SIZE - 1), 1)
+        self.screen.blits(self.atlas.sprites(
+            'ghost', [(x * GRID_SIZE, y * GRID_SIZE) for x, y in ghost.get_shape_positions()]
+        ), doreturn=False)
+    
+    def _render_hint_piece(self):
+        """渲染 AI 建议的落点"""
+        self.screen.blits(self.atlas.sprites(
+            'hint', [(x * GRID_SIZE, y * GRID_SIZE) for x, y in self.hint_piece.get_shape_positions()]
+        ), doreturn=False)
     
     def _render_sidebar(self):
-        """渲染侧边栏"""
+        """渲染侧边栏中随游戏变化的内容"""
         sidebar_x = GRID_WIDTH * GRID_SIZE + 20
         
-        next_text = self.small_font.render(self._t('sidebar.next'), True, COLORS['WHITE'])
-        self.screen.blit(next_text, (sidebar_x, 20))
-        
-        if self.board.next_piece:
-            for y, row in enumerate(self.board.next_piece.shape):
-                for x, cell in enumerate(row):
-                    if cell:
-                        pygame.draw.rect(self.screen, self.board.next_piece.color,
-                                         (sidebar_x + x * 20, 60 + y * 20, 18, 18))
+        next_piece = self.board.next_piece
+        if next_piece:
+            self.screen.blits(self.atlas.sprites(
+                ('preview', next_piece.shape_index),
+                [(sidebar_x + x * PREVIEW_SIZE, 60 + y * PREVIEW_SIZE) for x, y in next_piece.cells]
+            ), doreturn=False)
         
-        score_text = self.small_font.render(
-            f"{self._t('sidebar.score')}: {int(self.score)}", True, COLORS['WHITE']
+        score_text = self.text_cache.render(
+            self.small_font, f"{self._t('sidebar.score')}: {int(self.score)}", True, COLORS['WHITE']
         )
         self.screen.blit(score_text, (sidebar_x, 150))
         
-        level_text = self.small_font.render(
-            f"{self._t('sidebar.level')}: {self.level}", True, COLORS['WHITE']
+        level_text = self.text_cache.render(
+            self.small_font, f"{self._t('sidebar.level')}: {self.level}", True, COLORS['WHITE']
         )
         self.screen.blit(level_text, (sidebar_x, 180))
         
-        lines_text = self.small_font.render(
-            f"{self._t('sidebar.lines')}: {self.lines_cleared}", True, COLORS['WHITE']
+        lines_text = self.text_cache.render(
+            self.small_font, f"{self._t('sidebar.lines')}: {self.lines_cleared}", True, COLORS['WHITE']
         )
         self.screen.blit(lines_text, (sidebar_x, 210))
         
-        diff_text = self.small_font.render(
+        diff_text = self.text_cache.render(
+            self.small_font,
             f"{self._t('sidebar.difficulty')}: {difficulty_label(self.language, self.difficulty)}",
             True,
             COLORS['WHITE']
         )
         self.screen.blit(diff_text, (sidebar_x, 240))
         
-        controls_y = 320
-        controls = [
-            self._t('sidebar.controls'),
-            self._t('controls.left_right'),
-            self._t('controls.rotate'),
-            self._t('controls.soft_drop'),
-            self._t('controls.hard_drop'),
-            self._t('controls.pause'),
-            self._t('controls.menu')
+        if self.autoplay:
+            autoplay_text = self.text_cache.render(self.small_font, self._t('sidebar.autoplay'), True, COLORS['YELLOW'])
+            self.screen.blit(autoplay_text, (sidebar_x, 270))
+    
+    def _refresh_profiler_hud(self):
+        """每 0.25 秒刷新一次帧耗时面板的内容，内容变化时返回 True"""
+        now = time.perf_counter()
+        if now - self.profiler_hud_time < 0.25:
+            return False
+        self.profiler_hud_time = now
+        
+        stats = self.profiler.get_stats()
+        lines = [
+            f"FPS {stats['fps']:.0f}",
+            f"frame p50 {stats['p50_ms']:.2f} / p99 {stats['p99_ms']:.2f} ms",
+            f"dropped {stats['dropped_frames']} / {stats['total_frames']}"
         ]
-        for i, text in enumerate(controls):
-            control_text = self.small_font.render(text, True, COLORS['LIGHT_GRAY'])
-            self.screen.blit(control_text, (sidebar_x, controls_y + i * 25))
+        for name in ('events', 'update', 'render'):
+            phase = stats['phases'].get(name)
+            if phase:
+                lines.append(f"{name} p99 {phase['p99_ms']:.2f} ms")
+        changed = lines != self.profiler_hud_lines
+        self.profiler_hud_lines = lines
+        return changed
+    
+    def _render_profiler_hud(self):
+        """渲染帧耗时面板"""
+        pygame.draw.rect(self.screen, COLORS['BLACK'], self.profiler_hud_rect)
+        for i, line in enumerate(self.profiler_hud_lines):
+            # 数值每次都会变化，直接渲染而不放入文字缓存
+            text = self.tiny_font.render(line, True, COLORS['GREEN'])
+            self.screen.blit(text, (self.profiler_hud_rect.x + 8, self.profiler_hud_rect.y + 6 + i * 18))
     
     def _render_pause_overlay(self):
         """渲染暂停覆盖层"""
@@ -643,11 +1099,11 @@ class GameEngine:
         overlay.fill(COLORS['BLACK'])
         self.screen.blit(overlay, (0, 0))
         
-        pause_text = self.font.render(self._t('pause.title'), True, COLORS['WHITE'])
+        pause_text = self.text_cache.render(self.font, self._t('pause.title'), True, COLORS['WHITE'])
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(pause_text, pause_rect)
         
-        resume_text = self.small_font.render(self._t('pause.resume'), True, COLORS['WHITE'])
+        resume_text = self.text_cache.render(self.small_font, self._t('pause.resume'), True, COLORS['WHITE'])
         resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
         self.screen.blit(resume_text, resume_rect)
     
@@ -658,11 +1114,12 @@ class GameEngine:
         overlay.fill(COLORS['BLACK'])
         self.screen.blit(overlay, (0, 0))
         
-        game_over_text = self.font.render(self._t('game_over.title'), True, COLORS['RED'])
+        game_over_text = self.text_cache.render(self.font, self._t('game_over.title'), True, COLORS['RED'])
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
         self.screen.blit(game_over_text, game_over_rect)
         
-        final_score_text = self.small_font.render(
+        final_score_text = self.text_cache.render(
+            self.small_font,
             f"{self._t('game_over.final_score')}: {int(self.score)}",
             True,
             COLORS['WHITE']
@@ -670,21 +1127,22 @@ class GameEngine:
         final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(final_score_text, final_score_rect)
         
-        restart_text = self.small_font.render(self._t('game_over.continue'), True, COLORS['WHITE'])
+        restart_text = self.text_cache.render(self.small_font, self._t('game_over.continue'), True, COLORS['WHITE'])
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
         self.screen.blit(restart_text, restart_rect)
         
-        menu_text = self.small_font.render(self._t('game_over.menu'), True, COLORS['WHITE'])
+        menu_text = self.text_cache.render(self.small_font, self._t('game_over.menu'), True, COLORS['WHITE'])
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))
         self.screen.blit(menu_text, menu_rect)
     
     def _render_high_scores(self):
         """渲染高分榜"""
-        title = self.font.render(self._t('high_scores.title'), True, COLORS['YELLOW'])
+        title = self.text_cache.render(self.font, self._t('high_scores.title'), True, COLORS['YELLOW'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
-        high_scores = self.high_score_manager.get_high_scores()
+        page_size = self.high_score_manager.max_scores
+        high_scores = self.high_score_manager.get_leaderboard(self.high_scores_page)
         headers = [
             self._t('high_scores.rank'),
             self._t('high_scores.player'),
@@ -696,27 +1154,36 @@ class GameEngine:
         x_positions = [150, 220, 320, 400, 470, 550]
         
         for i, header in enumerate(headers):
-            text = self.small_font.render(header, True, COLORS['LIGHT_GRAY'])
+            text = self.text_cache.render(self.small_font, header, True, COLORS['LIGHT_GRAY'])
             self.screen.blit(text, (x_positions[i], 120))
         
-        for i, score_data in enumerate(high_scores[:10]):
+        for i, score_data in enumerate(high_scores[:page_size]):
             y = 160 + i * 30
-            color = COLORS['YELLOW'] if i == 0 else COLORS['WHITE']
-            self.screen.blit(self.small_font.render(f"#{i+1}", True, color), (x_positions[0], y))
-            self.screen.blit(self.small_font.render(score_data['name'][:10], True, color), (x_positions[1], y))
-            self.screen.blit(self.small_font.render(str(score_data['score']), True, color), (x_positions[2], y))
-            self.screen.blit(self.small_font.render(str(score_data['level']), True, color), (x_positions[3], y))
-            self.screen.blit(self.small_font.render(str(score_data['lines']), True, color), (x_positions[4], y))
-            date_text = self.tiny_font.render(score_data['date'][:10], True, color)
+            rank = self.high_scores_page * page_size + i + 1
+            color = COLORS['YELLOW'] if rank == 1 else COLORS['WHITE']
+            self.screen.blit(self.text_cache.render(self.small_font, f"#{rank}", True, color), (x_positions[0], y))
+            self.screen.blit(self.text_cache.render(self.small_font, score_data['name'][:10], True, color), (x_positions[1], y))
+            self.screen.blit(self.text_cache.render(self.small_font, str(score_data['score']), True, color), (x_positions[2], y))
+            self.screen.blit(self.text_cache.render(self.small_font, str(score_data['level']), True, color), (x_positions[3], y))
+            self.screen.blit(self.text_cache.render(self.small_font, str(score_data['lines']), True, color), (x_positions[4], y))
+            date_text = self.text_cache.render(self.tiny_font, score_data['date'][:10], True, color)
             self.screen.blit(date_text, (x_positions[5], y + 5))
         
-        back_text = self.small_font.render(self._t('game_over.menu'), True, COLORS['WHITE'])
+        pages = self.high_score_manager.get_page_count()
+        if pages > 1:
+            page_text = self.text_cache.render(
+                self.tiny_font, self._t('high_scores.page', page=self.high_scores_page + 1, pages=pages),
+                True, COLORS['LIGHT_GRAY']
+            )
+            self.screen.blit(page_text, page_text.get_rect(center=(SCREEN_WIDTH // 2, 470)))
+        
+        back_text = self.text_cache.render(self.small_font, self._t('game_over.menu'), True, COLORS['WHITE'])
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, 500))
         self.screen.blit(back_text, back_rect)
     
     def _render_statistics(self):
         """渲染统计数据"""
-        title = self.font.render(self._t('statistics.title'), True, COLORS['YELLOW'])
+        title = self.text_cache.render(self.font, self._t('statistics.title'), True, COLORS['YELLOW'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
@@ -738,64 +1205,65 @@ class GameEngine:
         
         y = 120
         for i, stat in enumerate(stat_items):
-            text = self.small_font.render(stat, True, COLORS['WHITE'])
+            text = self.text_cache.render(self.small_font, stat, True, COLORS['WHITE'])
             self.screen.blit(text, (200, y + i * 30))
         
         y = 420
-        diff_text = self.small_font.render(self._t('statistics.difficulty_distribution'), True, COLORS['LIGHT_GRAY'])
+        diff_text = self.text_cache.render(self.small_font, self._t('statistics.difficulty_distribution'), True, COLORS['LIGHT_GRAY'])
         self.screen.blit(diff_text, (200, y))
         
         difficulty_stats = stats['games_per_difficulty']
         for i, (difficulty, count) in enumerate(difficulty_stats.items()):
             y = 450 + i * 25
             label = difficulty_label(self.language, difficulty)
-            text = self.tiny_font.render(
+            text = self.text_cache.render(
+                self.tiny_font,
                 f"{label}: {count} {self._t('statistics.games_suffix')}",
                 True,
                 COLORS['WHITE']
             )
             self.screen.blit(text, (220, y))
         
-        back_text = self.small_font.render(self._t('game_over.menu'), True, COLORS['WHITE'])
+        back_text = self.text_cache.render(self.small_font, self._t('game_over.menu'), True, COLORS['WHITE'])
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, 550))
         self.screen.blit(back_text, back_rect)
     
     def _render_high_score_entry(self):
         """渲染高分输入界面"""
-        title = self.font.render(self._t('high_score_entry.title'), True, COLORS['YELLOW'])
+        title = self.text_cache.render(self.font, self._t('high_score_entry.title'), True, COLORS['YELLOW'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
         
-        score_text = self.font.render(
-            f"{self._t('high_score_entry.score')}: {int(self.score)}", True, COLORS['WHITE']
+        score_text = self.text_cache.render(
+            self.font, f"{self._t('high_score_entry.score')}: {int(self.score)}", True, COLORS['WHITE']
         )
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 220))
         self.screen.blit(score_text, score_rect)
         
-        prompt_text = self.small_font.render(self._t('high_score_entry.prompt'), True, COLORS['WHITE'])
+        prompt_text = self.text_cache.render(self.small_font, self._t('high_score_entry.prompt'), True, COLORS['WHITE'])
         prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, 300))
         self.screen.blit(prompt_text, prompt_rect)
         
         input_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 330, 300, 40)
         pygame.draw.rect(self.screen, COLORS['WHITE'], input_rect, 2)
         
-        name_text = self.small_font.render(self.player_name + "_", True, COLORS['WHITE'])
+        name_text = self.text_cache.render(self.small_font, self.player_name + "_", True, COLORS['WHITE'])
         name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, 350))
         self.screen.blit(name_text, name_rect)
         
-        hint_text = self.tiny_font.render(self._t('high_score_entry.hint'), True, COLORS['LIGHT_GRAY'])
+        hint_text = self.text_cache.render(self.tiny_font, self._t('high_score_entry.hint'), True, COLORS['LIGHT_GRAY'])
         hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, 400))
         self.screen.blit(hint_text, hint_rect)
     
     def _render_settings(self):
         """渲染设置菜单"""
-        title = self.font.render(self._t('settings.title'), True, COLORS['YELLOW'])
+        title = self.text_cache.render(self.font, self._t('settings.title'), True, COLORS['YELLOW'])
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         for i, item in enumerate(self.settings_menu_entries):
             color = COLORS['YELLOW'] if i == self.settings_menu_index else COLORS['WHITE']
-            text = self.small_font.render(item['label'], True, color)
+            text = self.text_cache.render(self.small_font, item['label'], True, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 40))
             self.screen.blit(text, text_rect)
         
@@ -806,19 +1274,69 @@ class GameEngine:
             self._t('settings.hint.esc')
         ]
         for i, control in enumerate(controls):
-            text = self.tiny_font.render(control, True, COLORS['LIGHT_GRAY'])
+            text = self.text_cache.render(self.tiny_font, control, True, COLORS['LIGHT_GRAY'])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 400 + i * 20))
             self.screen.blit(text, text_rect)
             
+    def _target_fps(self):
+        """当前状态的目标帧率（可在设置中按状态配置）"""
+        if not self.window_active:
+            default = UNFOCUSED_FPS
+            fps = self.settings_manager.get_setting('unfocused_fps', default)
+        else:
+            default = STATE_FPS.get(self.game_state, FPS)
+            frame_rates = self.settings_manager.get_setting('frame_rates', STATE_FPS)
+            fps = frame_rates.get(self.game_state, default) if isinstance(frame_rates, dict) else default
+        # 设置文件可手动编辑：不是有限数字时使用默认值，并限制在 1 ~ 1000 之间
+        try:
+            fps = float(fps)
+        except (TypeError, ValueError):
+            fps = default
+        if not math.isfinite(fps):
+            fps = default
+        return min(max(fps, 1), 1000)
+    
+    def _wait_next_frame(self):
+        """等待下一帧：游戏中按帧率节拍，其余状态阻塞等待事件直到超时"""
+        fps = self._target_fps()
+        if self.game_state == 'PLAYING':
+            self.clock.tick(fps)
+            return
+        
+        event = pygame.event.wait(max(1, int(1000 / fps)))
+        if event.type != pygame.NOEVENT:
+            self.pending_event = event
+        self.clock.tick()
+    
     def run(self):
         """运行游戏主循环"""
         running = True
         
+        self.render()
+        self.startup_timings.append(('first frame', time.perf_counter() - self.startup_start))
+        threading.Thread(target=self._preload, name='preload', daemon=True).start()
+        
         while running:
-            running = self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            self.profiler.begin_frame()
+            with self.profiler.phase('events'):
+                running = self.handle_events()
+            with self.profiler.phase('update'):
+                self.update()
+            with self.profiler.phase('render'):
+                self.render()
+            self.profiler.end_frame()
+            self._wait_next_frame()
             
+        self._shutdown()
+    
+    def _shutdown(self):
+        """退出游戏：导出帧耗时数据，保存未写入的数据后关闭 pygame"""
+        if self.profile_path:
+            self.profiler.export(self.profile_path)
+        # 保存未写入的设置，并等待后台写入完成，保证设置、统计与高分已落盘
+        self.settings_manager.flush()
+        persistence.flush()
+        if self._high_score_manager is not None:
+            self._high_score_manager.flush()
         pygame.quit()
         sys.exit()
@@ -1,94 +1,175 @@
 import json
 import os
+import sqlite3
+import threading
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
 from typing import List, Dict, Any
+from .history import GameHistory
 
 class HighScoreManager:
-    """高分管理器"""
+    """高分管理器
+
+    每局游戏都记录在 ``data/history.db``（SQLite）中，排行榜即按分数排序的查询。
+    前 max_scores 名缓存在 ``high_scores`` 中供每帧渲染使用，全部分数按升序保存在
+    ``scores`` 中，排名查询用二分查找。记录与改名先更新内存，再交给数据库的后台线程写入；
+    记录 ID 由数据库在写入时分配，同一数据目录可供多个游戏实例同时使用。
+    旧版的 ``highscores.json`` 会在首次启动时导入数据库。
+    """
     
     def __init__(self, data_dir: str = "data"):
         """初始化高分管理器"""
         self.data_dir = data_dir
         self.high_scores_file = os.path.join(data_dir, "highscores.json")
-        self.max_scores = 10  # 保存最多10个高分
+        self.history_file = os.path.join(data_dir, "history.db")
+        self.max_scores = 10  # 排行榜每页显示的数量
         self.high_scores = []
+        self.scores = None  # 全部分数（升序），后台加载完成前为 None
+        self.pending_scores = []  # 加载完成前记录的分数
+        self.lock = threading.Lock()
         
         # 确保数据目录存在
         os.makedirs(data_dir, exist_ok=True)
         
+        self.history = GameHistory(self.history_file)
+        
         # 加载现有高分
         self.load_high_scores()
     
     def load_high_scores(self) -> None:
-        """加载高分数据"""
+        """加载排行榜（必要时先导入旧版 highscores.json），全部分数在后台线程中加载"""
+        if self.history.get_meta('highscores_json_migrated') is None:
+            self._migrate_json()
+        self._refresh()
+        self.history.submit(self._load_scores)
+    
+    def _migrate_json(self) -> None:
+        """把旧版 highscores.json 中的记录导入数据库（原文件保留不动）"""
         try:
             if os.path.exists(self.high_scores_file):
                 with open(self.high_scores_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.high_scores = data.get('high_scores', [])
-            else:
-                self.high_scores = []
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"加载高分数据失败: {e}")
-            self.high_scores = []
+                self.history.add_games(data.get('high_scores', []))
+            self.history.set_meta('highscores_json_migrated', datetime.now().isoformat())
+        except (json.JSONDecodeError, IOError, sqlite3.Error) as e:
+            print(f"导入旧版高分数据失败: {e}")
     
-    def save_high_scores(self) -> bool:
-        """保存高分数据"""
-        try:
-            data = {
-                'high_scores': self.high_scores,
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            # 创建备份
-            if os.path.exists(self.high_scores_file):
-                backup_file = self.high_scores_file + ".bak"
-                try:
-                    import shutil
-                    shutil.copy2(self.high_scores_file, backup_file)
-                except:
-                    pass  # 备份失败不影响主操作
-            
-            with open(self.high_scores_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            return True
-        except IOError as e:
-            print(f"保存高分数据失败: {e}")
-            return False
+    def _refresh(self) -> None:
+        """重新查询排行榜前 max_scores 名"""
+        self.high_scores = self.history.top_scores(self.max_scores)
     
-    def add_score(self, name: str, score: int, level: int, lines: int, default_name: str = "Anonymous") -> bool:
-        """添加新分数"""
-        if not name.strip():
-            name = default_name
-        
-        new_score = {
+    def _load_scores(self) -> None:
+        """在数据库线程中读取全部分数；读取期间记录的游戏尚未写入数据库，加载完成后补上"""
+        scores = self.history.all_scores()
+        with self.lock:
+            for score in self.pending_scores:
+                insort(scores, score)
+            self.pending_scores = []
+            self.scores = scores
+    
+    def flush(self) -> None:
+        """等待数据库的后台写入完成"""
+        self.history.flush()
+    
+    @property
+    def total_games(self) -> int:
+        """记录的游戏总数（全部分数加载完成前只计入排行榜上的记录）"""
+        with self.lock:
+            if self.scores is None:
+                return len(self.high_scores)
+            return len(self.scores)
+    
+    def record_game(self, score: int, level: int, lines: int, difficulty: str = None,
+                    name: str = "Anonymous") -> Dict[str, Any]:
+        """记录一局结束的游戏，返回该局的记录（数据库由后台线程写入，写入后才有 id）"""
+        now = datetime.now()
+        record = {
+            'id': None,
             'name': name.strip(),
             'score': score,
             'level': level,
             'lines': lines,
-            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'timestamp': datetime.now().timestamp()
+            'difficulty': difficulty,
+            'date': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': now.timestamp()
         }
+        self.history.submit(self._insert, record, dict(record))
         
-        # 检查是否应该进入排行榜
+        with self.lock:
+            if self.scores is None:
+                self.pending_scores.append(score)
+            else:
+                insort(self.scores, score)
         if len(self.high_scores) < self.max_scores or score > self.get_min_score():
-            self.high_scores.append(new_score)
-            self.high_scores.sort(key=lambda x: x['score'], reverse=True)
-            self.high_scores = self.high_scores[:self.max_scores]
-            return self.save_high_scores()
-        
-        return False
+            high_scores = sorted(self.high_scores + [record], key=lambda s: (-s['score'], s['timestamp']))
+            self.high_scores = high_scores[:self.max_scores]
+        return record
+    
+    def _insert(self, record: Dict[str, Any], values: Dict[str, Any]) -> None:
+        """在数据库线程中写入一局游戏；失败时撤销内存中的这局记录，保持与数据库一致"""
+        try:
+            record['id'] = self.history.add_game(values)
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            print(f"保存高分数据失败: {e}")
+            with self.lock:
+                if self.scores is None:
+                    self.pending_scores.remove(record['score'])
+                else:
+                    del self.scores[bisect_left(self.scores, record['score'])]
+                self.high_scores = [s for s in self.high_scores if s is not record]
+    
+    def set_player_name(self, game: Dict[str, Any], name: str, default_name: str = "Anonymous") -> bool:
+        """为 record_game 返回的这局游戏设置玩家名"""
+        if not name.strip():
+            name = default_name
+        game['name'] = name.strip()
+        # 排在插入之后执行，此时已知数据库分配的 id；插入失败时 id 仍为 None，不做修改
+        self.history.submit(self._rename, game)
+        return True
+    
+    def _rename(self, game: Dict[str, Any]) -> None:
+        if game['id'] is not None:
+            self.history.rename_game(game['id'], game['name'])
+    
+    def add_score(self, name: str, score: int, level: int, lines: int, default_name: str = "Anonymous",
+                  difficulty: str = None) -> bool:
+        """添加新分数，返回是否进入排行榜前 max_scores 名"""
+        if not name.strip():
+            name = default_name
+        game = self.record_game(score, level, lines, difficulty, name)
+        return any(s is game for s in self.high_scores)
     
     def get_high_scores(self) -> List[Dict[str, Any]]:
-        """获取高分列表"""
+        """获取高分列表（前 max_scores 名）"""
         return self.high_scores.copy()
     
+    def get_leaderboard(self, page: int = 0, page_size: int = None, difficulty: str = None) -> List[Dict[str, Any]]:
+        """分页获取排行榜（page 从 0 开始，可按难度过滤）"""
+        page_size = page_size or self.max_scores
+        if page == 0 and page_size == self.max_scores and difficulty is None:
+            return self.get_high_scores()
+        return self.history.top_scores(page_size, page * page_size, difficulty)
+    
+    def get_page_count(self, page_size: int = None) -> int:
+        """排行榜总页数"""
+        page_size = page_size or self.max_scores
+        return max(1, (self.total_games + page_size - 1) // page_size)
+    
+    def get_player_best(self, name: str) -> Dict[str, Any]:
+        """获取玩家的最佳成绩（没有记录时返回 None）"""
+        return self.history.player_best(name)
+    
+    def get_player_bests(self, page: int = 0, page_size: int = None) -> List[Dict[str, Any]]:
+        """分页获取每位玩家的最佳分数"""
+        page_size = page_size or self.max_scores
+        return self.history.player_bests(page_size, page * page_size)
+    
     def get_min_score(self) -> int:
-        """获取排行榜最低分数"""
+        """获取排行榜（前 max_scores 名）最低分数"""
         if not self.high_scores:
             return 0
-        return min(score['score'] for score in self.high_scores)
+        return self.high_scores[-1]['score']
     
     def get_max_score(self) -> int:
         """获取最高分数"""
@@ -97,20 +178,30 @@ class HighScoreManager:
         return self.high_scores[0]['score']
     
     def get_rank(self, score: int) -> int:
-        """获取分数排名（如果不在排行榜返回-1）"""
-        for i, high_score in enumerate(self.high_scores):
-            if score >= high_score['score']:
-                return i + 1
-        return -1
+        """获取分数在全部游戏中的排名"""
+        with self.lock:
+            if self.scores is not None:
+                return len(self.scores) - bisect_right(self.scores, score) + 1
+            pending_above = sum(1 for s in self.pending_scores if s > score)
+        # 全部分数尚未加载完成时直接查询数据库
+        return self.history.count_above(score) + pending_above + 1
     
     def is_high_score(self, score: int) -> bool:
-        """检查是否为高分"""
-        return len(self.high_scores) < self.max_scores or score > self.get_min_score()
+        """检查分数能否进入排行榜前 max_scores 名"""
+        return sum(1 for s in self.high_scores if s['score'] > score) < self.max_scores
     
     def clear_all_scores(self) -> bool:
-        """清除所有高分"""
-        self.high_scores = []
-        return self.save_high_scores()
+        """清除所有游戏记录"""
+        self.history.flush()
+        try:
+            self.history.clear()
+        except sqlite3.Error as e:
+            print(f"清除高分数据失败: {e}")
+            return False
+        with self.lock:
+            self.scores = array('q')
+        self._refresh()
+        return True
     
     def export_scores(self, filename: str) -> bool:
         """导出分数到文件"""
@@ -128,26 +219,27 @@ class HighScoreManager:
     
     def import_scores(self, filename: str) -> bool:
         """从文件导入分数"""
+        self.history.flush()
         try:
             with open(filename, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 imported_scores = data.get('high_scores', [])
                 
-                # 合并分数并重新排序
-                all_scores = self.high_scores + imported_scores
-                # 去重（相同姓名和分数的记录）
-                unique_scores = []
+                # 去重（相同姓名、分数与时间的记录）
+                new_scores = []
                 seen = set()
-                for score in all_scores:
+                for score in imported_scores:
                     key = (score['name'], score['score'], score['timestamp'])
-                    if key not in seen:
+                    if key not in seen and not self.history.has_game(*key):
                         seen.add(key)
-                        unique_scores.append(score)
-                
-                unique_scores.sort(key=lambda x: x['score'], reverse=True)
-                self.high_scores = unique_scores[:self.max_scores]
+                        new_scores.append(score)
                 
-                return self.save_high_scores()
-        except (json.JSONDecodeError, IOError, KeyError) as e:
+                self.history.add_games(new_scores)
+                with self.lock:
+                    for score in new_scores:
+                        insort(self.scores, score['score'])
+                self._refresh()
+                return True
+        except (json.JSONDecodeError, IOError, KeyError, sqlite3.Error) as e:
             print(f"导入分数失败: {e}")
             return False
@@ -0,0 +1,180 @@
+import atexit
+import queue
+import sqlite3
+import threading
+from array import array
+from typing import List, Dict, Any, Iterable, Optional
+from .constants import PERSISTENCE_QUEUE_SIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    difficulty TEXT,
+    date TEXT NOT NULL,
+    timestamp REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_score ON games (score DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_games_timestamp ON games (timestamp);
+CREATE INDEX IF NOT EXISTS idx_games_difficulty_score_time ON games (difficulty, score DESC, timestamp);
+CREATE INDEX IF NOT EXISTS idx_games_name_score ON games (name, score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = ('name', 'score', 'level', 'lines', 'difficulty', 'date', 'timestamp')
+
+
+class GameHistory:
+    """游戏历史记录（SQLite）
+
+    保存每一局结束的游戏，不限数量。按分数、时间、难度与玩家名建立索引：排行榜分页与
+    玩家最佳成绩都走索引，不需要把全部记录读入内存排序。
+    游戏中的写入通过 ``submit`` 交给后台线程按提交顺序执行，游戏循环不等待磁盘。
+    使用 SQLite 默认的回滚日志：WAL 模式不支持网络文件系统上的数据目录。
+    连接在多个线程中使用，所有访问都经过同一把锁。
+    """
+
+    def __init__(self, db_file: str, max_pending: int = PERSISTENCE_QUEUE_SIZE):
+        """打开（必要时创建）数据库并启动写入线程"""
+        self.db_file = db_file
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+        
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.errors = 0
+        self.thread = threading.Thread(target=self._run, name='history-writer', daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, func, *args) -> None:
+        """把一次数据库操作交给后台线程（按提交顺序执行）"""
+        self.queue.put((func, args))
+
+    def _run(self):
+        while True:
+            func, args = self.queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                # 任何异常都不能让写入线程退出，否则队列不再消费，flush 与提交都会一直阻塞
+                self.errors += 1
+                print(f"保存游戏记录失败: {e}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self) -> None:
+        """等待所有已提交的操作完成"""
+        self.queue.join()
+
+    def _query(self, sql: str, params=()) -> List[Dict[str, Any]]:
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def _scalar(self, sql: str, params=()):
+        with self.lock:
+            row = self.conn.execute(sql, params).fetchone()
+        return row[0] if row else None
+
+    def add_game(self, record: Dict[str, Any]) -> int:
+        """添加一局游戏，返回数据库分配的记录 ID"""
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                [record.get(column) for column in COLUMNS]
+            )
+        return cursor.lastrowid
+
+    def add_games(self, records: Iterable[Dict[str, Any]]) -> int:
+        """在同一事务中批量添加游戏记录，返回添加的数量"""
+        rows = [[record.get(column) for column in COLUMNS] for record in records]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", rows
+            )
+        return len(rows)
+
+    def has_game(self, name: str, score: int, timestamp: float) -> bool:
+        """检查是否已有相同姓名、分数与时间的记录"""
+        return self._scalar(
+            "SELECT 1 FROM games WHERE name = ? AND score = ? AND timestamp = ? LIMIT 1",
+            (name, score, timestamp)
+        ) is not None
+
+    def rename_game(self, game_id: int, name: str) -> None:
+        """修改一局游戏的玩家名"""
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE games SET name = ? WHERE id = ?", (name, game_id))
+
+    def count(self, difficulty: Optional[str] = None) -> int:
+        """游戏总数（可按难度过滤）"""
+        if difficulty is None:
+            return self._scalar("SELECT COUNT(*) FROM games")
+        return self._scalar("SELECT COUNT(*) FROM games WHERE difficulty = ?", (difficulty,))
+
+    def all_scores(self, chunk_size: int = 10000) -> array:
+        """按升序返回全部分数（只读分数索引，分批读取，期间其他线程仍可查询）"""
+        scores = array('q')
+        with self.lock:
+            cursor = self.conn.execute("SELECT score FROM games ORDER BY score")
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return scores
+            scores.extend(row[0] for row in rows)
+
+    def count_above(self, score: int) -> int:
+        """分数高于 score 的记录数"""
+        return self._scalar("SELECT COUNT(*) FROM games WHERE score > ?", (score,))
+
+    def top_scores(self, limit: int, offset: int = 0, difficulty: Optional[str] = None) -> List[Dict[str, Any]]:
+        """按分数从高到低取一页记录（同分时先达成者在前）"""
+        if difficulty is None:
+            return self._query(
+                "SELECT * FROM games ORDER BY score DESC, timestamp LIMIT ? OFFSET ?", (limit, offset)
+            )
+        return self._query(
+            "SELECT * FROM games WHERE difficulty = ? ORDER BY score DESC, timestamp LIMIT ? OFFSET ?",
+            (difficulty, limit, offset)
+        )
+
+    def player_best(self, name: str) -> Optional[Dict[str, Any]]:
+        """玩家的最佳成绩"""
+        rows = self._query("SELECT * FROM games WHERE name = ? ORDER BY score DESC LIMIT 1", (name,))
+        return rows[0] if rows else None
+
+    def player_bests(self, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        """每位玩家的最佳分数，按分数从高到低分页"""
+        return self._query(
+            "SELECT name, MAX(score) AS score, COUNT(*) AS games FROM games "
+            "GROUP BY name ORDER BY score DESC LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+
+    def clear(self) -> None:
+        """删除所有游戏记录"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM games")
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """读取元数据"""
+        return self._scalar("SELECT value FROM meta WHERE key = ?", (key,))
+
+    def set_meta(self, key: str, value: str) -> None:
+        """写入元数据"""
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self.lock:
+            self.conn.close()
@@ -51,6 +51,9 @@ STRINGS = {
         "controls.hard_drop": "空格 硬降",
         "controls.pause": "P 暂停",
         "controls.menu": "ESC 菜单",
+        "controls.autoplay": "A 自动演示",
+        "controls.hint": "H 落点提示",
+        "sidebar.autoplay": "自动演示中",
         "pause.title": "游戏暂停",
         "pause.resume": "按 P 继续游戏",
         "game_over.title": "游戏结束",
@@ -64,6 +67,7 @@ STRINGS = {
         "high_scores.level": "等级",
         "high_scores.lines": "行数",
         "high_scores.date": "日期",
+        "high_scores.page": "第 {page}/{pages} 页  ← → 翻页",
         "statistics.title": "游戏统计",
         "statistics.total_games": "总游戏次数",
         "statistics.total_time": "总游戏时间",
@@ -128,6 +132,9 @@ STRINGS = {
         "controls.hard_drop": "Space Hard drop",
         "controls.pause": "P Pause",
         "controls.menu": "ESC Menu",
+        "controls.autoplay": "A Autoplay",
+        "controls.hint": "H Hint",
+        "sidebar.autoplay": "AUTOPLAY",
         "pause.title": "Paused",
         "pause.resume": "Press P to resume",
         "game_over.title": "Game Over",
@@ -141,6 +148,7 @@ STRINGS = {
         "high_scores.level": "Level",
         "high_scores.lines": "Lines",
         "high_scores.date": "Date",
+        "high_scores.page": "Page {page}/{pages}  ← → to browse",
         "statistics.title": "Statistics",
         "statistics.total_games": "Total Games",
         "statistics.total_time": "Total Play Time",
@@ -205,6 +213,9 @@ STRINGS = {
         "controls.hard_drop": "Space ハードドロップ",
         "controls.pause": "P 一時停止",
         "controls.menu": "ESC メニュー",
+        "controls.autoplay": "A オートプレイ",
+        "controls.hint": "H ヒント",
+        "sidebar.autoplay": "オートプレイ中",
         "pause.title": "一時停止",
         "pause.resume": "Pで再開",
         "game_over.title": "ゲームオーバー",
@@ -218,6 +229,7 @@ STRINGS = {
         "high_scores.level": "レベル",
         "high_scores.lines": "ライン",
         "high_scores.date": "日付",
+        "high_scores.page": "{page}/{pages} ページ  ← → で切替",
         "statistics.title": "統計",
         "statistics.total_games": "総プレイ回数",
         "statistics.total_time": "総プレイ時間",
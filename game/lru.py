@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from typing import Dict, Any
+
+
+class LRUCache:
+    """有界 LRU 缓存
+
+    超出容量时淘汰最久未使用的条目，并记录命中/未命中/淘汰次数以便调整容量。
+    """
+
+    def __init__(self, max_entries: int):
+        """初始化缓存"""
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """查询缓存，命中时将条目标记为最近使用"""
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        return default
+
+    def store(self, key, value) -> None:
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """清空缓存与计数"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取容量与命中率统计"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0
+        }
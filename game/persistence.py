@@ -0,0 +1,138 @@
+import atexit
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from typing import Dict, Any
+from .constants import PERSISTENCE_QUEUE_SIZE
+
+
+def atomic_write(path: str, text: str, backup_path: str = None) -> None:
+    """原子写入：先写入同目录下的临时文件并落盘，再替换目标文件（可先备份旧文件）"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    if backup_path and os.path.exists(path):
+        try:
+            shutil.copy2(path, backup_path)
+        except OSError:
+            pass  # 备份失败不影响主操作
+
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def append_to_file(path: str, data: bytes) -> None:
+    """在文件末尾追加数据并落盘"""
+    with open(path, 'ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class WriteBehindWriter:
+    """后台写入线程
+
+    调用方把文件内容交给写入线程后立即返回，游戏循环不会等待磁盘。所有操作按提交顺序
+    执行：整文件写入（write）与追加（append）交错提交时，磁盘上的先后顺序与提交顺序一致。
+    同一文件的多次整文件写入在执行前被新的写入取代时直接跳过，只写最后一次；
+    等待执行的操作数达到 max_pending 时调用方才会阻塞。
+    """
+
+    def __init__(self, max_pending: int = PERSISTENCE_QUEUE_SIZE):
+        """初始化并启动写入线程"""
+        self.latest = {}  # 每个文件最新一次整文件写入的序号
+        self.sequence = 0
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.lock = threading.Lock()
+        self.writes = 0
+        self.appends = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self.thread.start()
+
+    def write(self, path: str, text: str, backup_path: str = None) -> None:
+        """提交一次整文件写入（原子替换，可先备份旧文件）"""
+        with self.lock:
+            self.sequence += 1
+            self.latest[path] = self.sequence
+            sequence = self.sequence
+        self.queue.put(('write', sequence, path, text, backup_path))
+
+    def append(self, path: str, data: bytes) -> None:
+        """提交一次追加写入（不会被合并或跳过）"""
+        self.queue.put(('append', None, path, data, None))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                operation, sequence, path, data, backup_path = item
+                if operation == 'append':
+                    append_to_file(path, data)
+                    self.appends += 1
+                    continue
+                with self.lock:
+                    superseded = self.latest.get(path) != sequence
+                if superseded:
+                    self.coalesced += 1
+                    continue
+                atomic_write(path, data, backup_path)
+                self.writes += 1
+                with self.lock:
+                    if self.latest.get(path) == sequence:
+                        del self.latest[path]
+            except Exception as e:
+                # 任何异常都不能让写入线程退出，否则队列不再消费，flush 与提交都会一直阻塞
+                self.errors += 1
+                print(f"保存文件失败: {e}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self) -> None:
+        """等待所有已提交的写入完成"""
+        self.queue.join()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取写入统计"""
+        return {
+            'writes': self.writes,
+            'appends': self.appends,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'pending': self.queue.qsize()
+        }
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> WriteBehindWriter:
+    """获取共享的后台写入线程（首次调用时启动，进程退出前自动等待写入完成）"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = WriteBehindWriter()
+            atexit.register(_writer.flush)
+        return _writer
+
+
+def flush() -> None:
+    """等待所有后台写入完成（未启动写入线程时直接返回）"""
+    if _writer is not None:
+        _writer.flush()
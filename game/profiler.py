@@ -0,0 +1,113 @@
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any
+from .constants import FPS, PROFILER_FRAMES, PROFILER_HISTOGRAM_MS
+
+
+class FrameProfiler:
+    """逐帧分阶段计时器
+
+    每帧记录各阶段（事件处理、逻辑更新、渲染及其子阶段）的耗时，最近 capacity 帧保存在
+    环形缓冲区中，用于计算 FPS、p50/p99 帧耗时；各阶段的耗时直方图（1 ms 一档）按整个运行期累计，
+    可在退出时导出为 JSON。单帧工作耗时超过预算（默认 1 / FPS）即计为掉帧。
+    """
+
+    def __init__(self, capacity: int = PROFILER_FRAMES, budget: float = 1 / FPS):
+        """初始化计时器"""
+        self.capacity = capacity
+        self.budget = budget
+        self.frames = deque(maxlen=capacity)
+        self.histograms = {}
+        self.total_frames = 0
+        self.dropped_frames = 0
+        self.hud_visible = False
+        self._phases = None
+        self._frame_start = None
+
+    def begin_frame(self) -> None:
+        """开始一帧"""
+        now = time.perf_counter()
+        self._interval = now - self._frame_start if self._frame_start is not None else 0.0
+        self._frame_start = now
+        self._phases = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """为一个阶段计时（同一帧内同名阶段的耗时会累加）"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._phases is not None:
+                self._phases[name] = self._phases.get(name, 0.0) + time.perf_counter() - start
+
+    def end_frame(self) -> None:
+        """结束一帧并记录耗时"""
+        if self._phases is None:
+            return
+        phases = self._phases
+        phases['frame'] = time.perf_counter() - self._frame_start
+        self._phases = None
+
+        self.frames.append((self._interval, phases))
+        self.total_frames += 1
+        if phases['frame'] > self.budget:
+            self.dropped_frames += 1
+        for name, seconds in phases.items():
+            histogram = self.histograms.setdefault(name, [0] * (PROFILER_HISTOGRAM_MS + 1))
+            histogram[min(int(seconds * 1000), PROFILER_HISTOGRAM_MS)] += 1
+
+    @staticmethod
+    def _percentile(ordered, p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """按环形缓冲区中的最近若干帧计算 FPS 与各阶段的 p50/p99（毫秒）"""
+        intervals = [interval for interval, _ in self.frames if interval > 0]
+        names = {}
+        for _, phases in self.frames:
+            for name, seconds in phases.items():
+                names.setdefault(name, []).append(seconds)
+
+        phase_stats = {}
+        for name, values in names.items():
+            ordered = sorted(values)
+            phase_stats[name] = {
+                'p50_ms': round(self._percentile(ordered, 0.5) * 1000, 3),
+                'p99_ms': round(self._percentile(ordered, 0.99) * 1000, 3),
+                'max_ms': round(ordered[-1] * 1000, 3)
+            }
+        frame = phase_stats.get('frame', {'p50_ms': 0, 'p99_ms': 0, 'max_ms': 0})
+        return {
+            'fps': round(len(intervals) / sum(intervals), 1) if intervals else 0,
+            'p50_ms': frame['p50_ms'],
+            'p99_ms': frame['p99_ms'],
+            'dropped_frames': self.dropped_frames,
+            'total_frames': self.total_frames,
+            'phases': phase_stats
+        }
+
+    def export(self, path: str) -> bool:
+        """把统计与各阶段直方图导出为 JSON"""
+        data = self.get_stats()
+        data['budget_ms'] = round(self.budget * 1000, 3)
+        data['histograms'] = {
+            name: {
+                (f"{bucket}+" if bucket == PROFILER_HISTOGRAM_MS else str(bucket)): count
+                for bucket, count in enumerate(histogram) if count
+            }
+            for name, histogram in self.histograms.items()
+        }
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            return True
+        except IOError as e:
+            print(f"导出帧耗时数据失败: {e}")
+            return False
@@ -0,0 +1,173 @@
+"""
+自对弈锦标赛
+
+在进程池中并行运行 N 局带种子的无界面游戏，统计分数、等级与消行分布。
+
+用法: python -m game.selfplay --games 1000 --workers 8 --policy game.ai:BeamSearchBot
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List
+
+from .constants import DIFFICULTY_SETTINGS
+from .simulation import GameSession
+
+DEFAULT_POLICY = 'game.ai:Bot'
+
+# 每个工作进程各自持有的走子策略
+_worker_policy = None
+
+
+def load_policy(spec: str):
+    """按 "模块:属性" 加载走子策略；策略是 board -> (rotation, x) 的可调用对象，类会被实例化"""
+    module_name, _, attr = spec.partition(':')
+    policy = getattr(importlib.import_module(module_name), attr)
+    return policy() if isinstance(policy, type) else policy
+
+
+def _init_worker(policy_spec: str) -> None:
+    global _worker_policy
+    _worker_policy = load_policy(policy_spec)
+
+
+def play_game(seed: int, difficulty: str, max_pieces: int, policy=None) -> Dict[str, Any]:
+    """用给定策略玩一局，规则与 GameEngine 完全一致（均由 GameSession 实现）"""
+    policy = policy or _worker_policy
+    session = GameSession(difficulty, seed=seed)
+    start = time.perf_counter()
+    while not session.game_over and session.pieces_placed < max_pieces:
+        placement = policy(session.board)
+        if placement:
+            session.board.place_piece(*placement)
+        session.hard_drop()
+    return {
+        'seed': seed,
+        'score': int(session.score),
+        'level': session.level,
+        'lines': session.lines_cleared,
+        'pieces': session.pieces_placed,
+        'difficulty': difficulty,
+        'topped_out': session.game_over,
+        'duration': time.perf_counter() - start,
+        'worker': os.getpid()
+    }
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        'min': ordered[0],
+        'mean': round(statistics.fmean(ordered), 2),
+        'p50': percentile(0.5),
+        'p90': percentile(0.9),
+        'p99': percentile(0.99),
+        'max': ordered[-1]
+    }
+
+
+def summarize(results: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+    """汇总对局结果（字段与 StatisticsManager 的统计数据一致）"""
+    summary = {
+        'total_games': len(results),
+        'total_play_time': round(sum(r['duration'] for r in results), 3),
+        'total_lines_cleared': sum(r['lines'] for r in results),
+        'total_score': sum(r['score'] for r in results),
+        'highest_score': max((r['score'] for r in results), default=0),
+        'highest_level': max((r['level'] for r in results), default=0),
+        'most_lines_cleared': max((r['lines'] for r in results), default=0),
+        'games_per_difficulty': {difficulty: 0 for difficulty in DIFFICULTY_SETTINGS}
+    }
+    for r in results:
+        summary['games_per_difficulty'][r['difficulty']] += 1
+    if not results:
+        return summary
+
+    summary['distributions'] = {
+        'score': _distribution([r['score'] for r in results]),
+        'level': _distribution([r['level'] for r in results]),
+        'lines': _distribution([r['lines'] for r in results]),
+        'pieces': _distribution([r['pieces'] for r in results])
+    }
+
+    # 吞吐量：整体按墙钟时间，单个工作进程按其实际计算时间
+    total_pieces = sum(r['pieces'] for r in results)
+    workers = {}
+    for r in results:
+        worker = workers.setdefault(str(r['worker']), {'games': 0, 'pieces': 0, 'busy_time': 0.0})
+        worker['games'] += 1
+        worker['pieces'] += r['pieces']
+        worker['busy_time'] += r['duration']
+    for worker in workers.values():
+        busy_time = worker['busy_time'] or 1e-9
+        worker['games_per_sec'] = round(worker['games'] / busy_time, 2)
+        worker['pieces_per_sec'] = round(worker['pieces'] / busy_time, 1)
+        worker['busy_time'] = round(worker['busy_time'], 3)
+    summary['throughput'] = {
+        'wall_time': round(wall_time, 3),
+        'games_per_sec': round(len(results) / wall_time, 2) if wall_time else 0,
+        'pieces_per_sec': round(total_pieces / wall_time, 1) if wall_time else 0,
+        'workers': workers
+    }
+    summary['topped_out'] = sum(1 for r in results if r['topped_out'])
+    return summary
+
+
+def run_tournament(games: int, workers: int = None, seed: int = 0, policy: str = DEFAULT_POLICY,
+                   difficulty: str = 'MEDIUM', max_pieces: int = 1000, on_result=None) -> Dict[str, Any]:
+    """在进程池中运行锦标赛，每局结束时回调 on_result(result, finished, games)"""
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(policy,)) as pool:
+        futures = [
+            pool.submit(play_game, seed + i, difficulty, max_pieces)
+            for i in range(games)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result:
+                on_result(result, len(results), games)
+    return summarize(results, time.perf_counter() - start)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="Run seeded headless Tetris games in parallel")
+    parser.add_argument('--games', type=int, default=100, help="number of games")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game; game i uses seed + i")
+    parser.add_argument('--policy', default=DEFAULT_POLICY, help="move policy as module:callable")
+    parser.add_argument('--difficulty', default='MEDIUM', choices=list(DIFFICULTY_SETTINGS))
+    parser.add_argument('--max-pieces', type=int, default=1000, help="stop a game after this many pieces")
+    parser.add_argument('--output', default=None, help="write the summary JSON to this file")
+    parser.add_argument('--quiet', action='store_true', help="do not print per-game results")
+    args = parser.parse_args(argv)
+
+    def report(result, finished, games):
+        if not args.quiet:
+            print(f"[{finished}/{games}] seed={result['seed']} score={result['score']} "
+                  f"level={result['level']} lines={result['lines']} pieces={result['pieces']} "
+                  f"({result['duration']:.2f}s)", flush=True)
+
+    summary = run_tournament(
+        args.games, args.workers, args.seed, args.policy, args.difficulty, args.max_pieces, report
+    )
+    text = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,11 @@
 import json
 import os
+import time
 from datetime import datetime
 from typing import Dict, Any
 import pygame
+from .constants import STATE_FPS, UNFOCUSED_FPS, SETTINGS_SAVE_DELAY
+from .persistence import get_writer
 
 class SettingsManager:
     """设置管理器"""
@@ -27,6 +30,10 @@ class SettingsManager:
             'show_grid': False,
             'theme': 'CLASSIC',
             'language': 'zh',
+            'dirty_rendering': False,
+            'frame_rates': dict(STATE_FPS),
+            'unfocused_fps': UNFOCUSED_FPS,
+            'interpolate_fall': False,
             'controls': {
                 'left': pygame.K_LEFT,
                 'right': pygame.K_RIGHT,
@@ -37,6 +44,11 @@ class SettingsManager:
             }
         }
         
+        # 未保存的修改：修改立即生效，空闲 SETTINGS_SAVE_DELAY 秒后或离开设置界面时再写入文件
+        self.dirty = False
+        self.last_change_time = 0.0
+        self.saved_text = None
+        
         # 加载设置
         self.settings = self.default_settings.copy()
         self.load_settings()
@@ -47,20 +59,44 @@ class SettingsManager:
             if os.path.exists(self.settings_file):
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
                     loaded_settings = json.load(f)
+                    self.saved_text = json.dumps(loaded_settings, ensure_ascii=False, indent=2)
                     # 合并设置，保留新版本的字段
                     self.settings.update(loaded_settings)
         except (json.JSONDecodeError, IOError) as e:
             print(f"加载设置失败: {e}")
     
     def save_settings(self) -> bool:
-        """保存设置"""
+        """立即保存设置（内容与上次写入相同时跳过，由后台线程原子替换文件）"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
-            return True
-        except IOError as e:
+            text = json.dumps(self.settings, ensure_ascii=False, indent=2)
+        except (TypeError, ValueError) as e:
             print(f"保存设置失败: {e}")
             return False
+        
+        self.dirty = False
+        if text != self.saved_text:
+            get_writer().write(self.settings_file, text)
+            self.saved_text = text
+        return True
+    
+    def _mark_dirty(self) -> None:
+        """记录一次未保存的修改"""
+        self.dirty = True
+        self.last_change_time = time.monotonic()
+    
+    def save_if_idle(self, now: float = None) -> bool:
+        """最后一次修改后已空闲 SETTINGS_SAVE_DELAY 秒时保存设置，返回是否进行了保存"""
+        if not self.dirty:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if now - self.last_change_time < SETTINGS_SAVE_DELAY:
+            return False
+        return self.save_settings()
+    
+    def flush(self) -> bool:
+        """有未保存的修改时立即保存"""
+        return self.save_settings() if self.dirty else True
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """获取设置值"""
@@ -69,8 +105,10 @@ class SettingsManager:
     def set_setting(self, key: str, value: Any) -> bool:
         """设置值"""
         if key in self.settings:
-            self.settings[key] = value
-            return self.save_settings()
+            if self.settings[key] != value:
+                self.settings[key] = value
+                self._mark_dirty()
+            return True
         return False
     
     def get_control(self, action: str) -> int:
@@ -81,13 +119,16 @@ class SettingsManager:
         """设置控制键"""
         if 'controls' not in self.settings:
             self.settings['controls'] = {}
-        self.settings['controls'][action] = key_code
-        return self.save_settings()
+        if self.settings['controls'].get(action) != key_code:
+            self.settings['controls'][action] = key_code
+            self._mark_dirty()
+        return True
     
     def reset_to_default(self) -> bool:
         """重置为默认设置"""
         self.settings = self.default_settings.copy()
-        return self.save_settings()
+        self._mark_dirty()
+        return True
     
     def export_settings(self, filename: str) -> bool:
         """导出设置"""
@@ -0,0 +1,110 @@
+import random
+from .constants import DIFFICULTY_SETTINGS, SCORE_RULES, GRID_WIDTH, GRID_HEIGHT
+from .tetris import GameBoard
+
+
+class GameSession:
+    """无界面游戏会话
+
+    负责游戏板、分数、等级、消行数与重力计时，不依赖 pygame，
+    可以在没有显示设备的环境中批量运行。``GameEngine`` 只是它的前端。
+    """
+
+    def __init__(self, difficulty: str = 'MEDIUM', seed=None,
+                 width: int = GRID_WIDTH, height: int = GRID_HEIGHT):
+        """初始化游戏会话（指定 seed 时方块序列可复现）"""
+        self.rng = random.Random(seed) if seed is not None else None
+        self.board = GameBoard(width, height, rng=self.rng)
+        self.difficulty = difficulty
+        self.reset()
+
+    def reset(self, difficulty: str = None) -> None:
+        """开始新的一局"""
+        if difficulty is not None:
+            self.difficulty = difficulty
+        self.board.reset()
+        self.score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.pieces_placed = 0
+        self.game_over = False
+        self.fall_speed = DIFFICULTY_SETTINGS[self.difficulty]['fall_speed']
+        self.fall_timer = 0
+        if not self.board.create_new_piece():
+            self.game_over = True
+
+    def move(self, dx: int) -> bool:
+        """左右移动方块"""
+        return not self.game_over and self.board.move_piece(dx, 0)
+
+    def rotate(self) -> bool:
+        """旋转方块"""
+        return not self.game_over and self.board.rotate_piece()
+
+    def soft_drop(self) -> bool:
+        """软降一行"""
+        if self.game_over or not self.board.move_piece(0, 1):
+            return False
+        self.score += SCORE_RULES['SOFT_DROP']
+        return True
+
+    def hard_drop(self) -> int:
+        """硬降并锁定方块，返回消除的行数"""
+        if self.game_over:
+            return 0
+        self.score += SCORE_RULES['HARD_DROP'] * self.board.hard_drop()
+        return self.lock_current_piece()
+
+    def update(self, dt: float):
+        """推进重力计时，方块因此锁定时返回消除的行数，否则返回 None"""
+        if self.game_over:
+            return None
+        self.fall_timer += dt
+        if self.fall_timer <= self.fall_speed:
+            return None
+        # 保留超出的部分，下落节奏不受调用间隔抖动影响
+        self.fall_timer -= self.fall_speed
+        return self.gravity_step()
+
+    def gravity_step(self):
+        """方块自动下落一行，无法下落时锁定并返回消除的行数"""
+        if self.board.move_piece(0, 1):
+            return None
+        return self.lock_current_piece()
+
+    def lock_current_piece(self) -> int:
+        """锁定当前方块并生成下一个，返回消除的行数"""
+        lines_cleared = self.board.lock_piece()
+        self.pieces_placed += 1
+
+        if lines_cleared > 0:
+            self.calculate_score(lines_cleared)
+            self.lines_cleared += lines_cleared
+
+            # 更新等级
+            self.level = self.lines_cleared // 10 + 1
+            self.update_fall_speed()
+
+        # 创建新方块
+        if not self.board.create_new_piece():
+            self.game_over = True
+        return lines_cleared
+
+    def calculate_score(self, lines_cleared: int) -> None:
+        """计算得分"""
+        score_multiplier = DIFFICULTY_SETTINGS[self.difficulty]['score_multiplier']
+
+        if lines_cleared == 1:
+            self.score += SCORE_RULES['SINGLE'] * self.level * score_multiplier
+        elif lines_cleared == 2:
+            self.score += SCORE_RULES['DOUBLE'] * self.level * score_multiplier
+        elif lines_cleared == 3:
+            self.score += SCORE_RULES['TRIPLE'] * self.level * score_multiplier
+        elif lines_cleared == 4:
+            self.score += SCORE_RULES['TETRIS'] * self.level * score_multiplier
+
+    def update_fall_speed(self) -> None:
+        """更新下落速度"""
+        base_speed = DIFFICULTY_SETTINGS[self.difficulty]['fall_speed']
+        speed_increase = 0.05 * (self.level - 1)
+        self.fall_speed = max(base_speed - speed_increase, 0.05)
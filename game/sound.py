@@ -1,12 +1,14 @@
 import os
+import threading
+import time
 import pygame
 
 
 class SoundManager:
     """音频管理器"""
 
-    def __init__(self, base_dir: str, settings_manager):
-        """初始化音频管理器"""
+    def __init__(self, base_dir: str, settings_manager, load_async: bool = False):
+        """初始化音频管理器（load_async 为 True 时在后台线程中初始化混音器并解码音频）"""
         self.base_dir = base_dir
         self.settings_manager = settings_manager
         self.sound_enabled = self.settings_manager.get_setting('sound_enabled', True)
@@ -15,10 +17,30 @@ class SoundManager:
         self.music_volume = self.settings_manager.get_setting('music_volume', 0.5)
         self.sounds = {}
         self.music_loaded = False
+        self.music_requested = False
+        self.load_time = None
+        self.loaded = threading.Event()
+        self._lock = threading.Lock()
 
+        if load_async:
+            threading.Thread(target=self._load, name='sound-loader', daemon=True).start()
+        else:
+            self._load()
+
+    def _load(self):
+        start = time.perf_counter()
         self._init_mixer()
-        self._load_sounds()
-        self._load_music()
+        sounds = self._load_sounds()
+        music_loaded = self._load_music()
+        self.load_time = time.perf_counter() - start
+        with self._lock:
+            # 加载完成后一次性发布，主线程不会遍历到正在填充的字典；音量按最新设置设定
+            self.sounds = sounds
+            self.music_loaded = music_loaded
+            self._apply_volume()
+            self.loaded.set()
+            if self.music_requested:
+                self.play_music()
 
     def _init_mixer(self):
         try:
@@ -27,6 +49,7 @@ class SoundManager:
             pass
 
     def _load_sounds(self):
+        sounds = {}
         sound_files = {
             'move': 'move.wav',
             'rotate': 'rotate.wav',
@@ -39,21 +62,20 @@ class SoundManager:
             path = os.path.join(sounds_dir, filename)
             if os.path.exists(path):
                 try:
-                    sound = pygame.mixer.Sound(path)
-                    sound.set_volume(self.sound_volume)
-                    self.sounds[key] = sound
+                    sounds[key] = pygame.mixer.Sound(path)
                 except pygame.error:
                     continue
+        return sounds
 
     def _load_music(self):
         music_path = os.path.join(self.base_dir, 'assets', 'sounds', 'bgm.ogg')
         if os.path.exists(music_path):
             try:
                 pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(self.music_volume)
-                self.music_loaded = True
+                return True
             except pygame.error:
-                self.music_loaded = False
+                pass
+        return False
 
     def play_sound(self, name: str):
         if not self.sound_enabled:
@@ -63,10 +85,17 @@ class SoundManager:
             sound.play()
 
     def play_music(self):
+        if not self.loaded.is_set():
+            with self._lock:
+                if not self.loaded.is_set():
+                    # 音频仍在后台加载，加载完成后再开始播放
+                    self.music_requested = True
+                    return
         if self.music_enabled and self.music_loaded:
             pygame.mixer.music.play(-1)
 
     def stop_music(self):
+        self.music_requested = False
         if self.music_loaded:
             pygame.mixer.music.stop()
 
@@ -76,6 +105,11 @@ class SoundManager:
         self.sound_volume = self.settings_manager.get_setting('sound_volume', 0.7)
         self.music_volume = self.settings_manager.get_setting('music_volume', 0.5)
 
+        with self._lock:
+            self._apply_volume()
+
+    def _apply_volume(self):
+        """把音量应用到已发布的音效与音乐（调用方持有 _lock）"""
         for sound in self.sounds.values():
             sound.set_volume(self.sound_volume)
         if self.music_loaded:
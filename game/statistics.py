@@ -1,25 +1,43 @@
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+from .constants import STATS_SNAPSHOT_INTERVAL
+from .persistence import get_writer
 
 class StatisticsManager:
-    """统计管理器"""
+    """统计管理器
+
+    每局结束的游戏作为一行 JSON 追加到 ``data/games.jsonl``（只追加，不重写）；汇总数据由
+    这些记录逐条流式累加得到。``data/statistics.json`` 是汇总快照，记录了它已包含的日志
+    字节偏移 ``log_offset``，启动时只回放偏移之后的记录；每追加 STATS_SNAPSHOT_INTERVAL
+    局重写一次快照。
+    """
     
     def __init__(self, data_dir: str = "data"):
         """初始化统计管理器"""
         self.data_dir = data_dir
         self.stats_file = os.path.join(data_dir, "statistics.json")
+        self.games_file = os.path.join(data_dir, "games.jsonl")
+        self.games_since_snapshot = 0
         
         # 确保数据目录存在
         os.makedirs(data_dir, exist_ok=True)
         
         # 初始化统计数据
-        self.stats = {
+        self.stats = self._empty_stats()
+        
+        # 加载现有统计数据
+        self.load_statistics()
+    
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
             'total_games': 0,
             'total_play_time': 0,  # 总游戏时间（秒）
             'total_lines_cleared': 0,
             'total_score': 0,
+            'total_pieces': 0,
             'highest_score': 0,
             'highest_level': 0,
             'most_lines_cleared': 0,
@@ -30,14 +48,12 @@ class StatisticsManager:
                 'EXPERT': 0
             },
             'session_start_time': None,
-            'last_session_date': None
+            'last_session_date': None,
+            'log_offset': 0  # 快照已包含的 games.jsonl 字节数
         }
-        
-        # 加载现有统计数据
-        self.load_statistics()
     
     def load_statistics(self) -> None:
-        """加载统计数据"""
+        """加载统计快照，并回放快照之后追加的游戏记录"""
         try:
             if os.path.exists(self.stats_file):
                 with open(self.stats_file, 'r', encoding='utf-8') as f:
@@ -46,14 +62,67 @@ class StatisticsManager:
                     self.stats.update(loaded_stats)
         except (json.JSONDecodeError, IOError) as e:
             print(f"加载统计数据失败: {e}")
+        
+        try:
+            self.games_since_snapshot = self._replay_log()
+        except IOError as e:
+            print(f"加载游戏记录失败: {e}")
+        if self.games_since_snapshot >= STATS_SNAPSHOT_INTERVAL:
+            self.save_statistics()
+    
+    def _replay_log(self) -> int:
+        """从快照偏移处流式累加游戏记录，返回回放的记录数"""
+        if not os.path.exists(self.games_file):
+            self.stats['log_offset'] = 0
+            return 0
+        
+        offset = self.stats['log_offset']
+        size = os.path.getsize(self.games_file)
+        if offset > size:
+            # 日志比快照短（被截断或替换过），快照之外没有可回放的记录
+            offset = size
+        count = 0
+        with open(self.games_file, 'r+b') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # 写入中途退出留下的半行，截掉后才能继续追加
+                    f.truncate(offset)
+                    break
+                try:
+                    self._accumulate(json.loads(line))
+                    count += 1
+                except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError) as e:
+                    print(f"跳过损坏的游戏记录: {e}")
+                offset += len(line)
+        self.stats['log_offset'] = offset
+        return count
+    
+    def _accumulate(self, game: Dict[str, Any]) -> None:
+        """把一局游戏记录累加到汇总数据"""
+        stats = self.stats
+        stats['total_games'] += 1
+        stats['total_score'] += game['score']
+        stats['total_lines_cleared'] += game['lines']
+        stats['total_play_time'] += game.get('duration', 0)
+        stats['total_pieces'] += game.get('pieces', 0)
+        
+        # 更新最高记录
+        stats['highest_score'] = max(stats['highest_score'], game['score'])
+        stats['highest_level'] = max(stats['highest_level'], game['level'])
+        stats['most_lines_cleared'] = max(stats['most_lines_cleared'], game['lines'])
+        
+        # 更新难度统计
+        if game.get('difficulty') in stats['games_per_difficulty']:
+            stats['games_per_difficulty'][game['difficulty']] += 1
     
     def save_statistics(self) -> bool:
-        """保存统计数据"""
+        """保存统计快照（由后台线程写入磁盘）"""
         try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, ensure_ascii=False, indent=2)
+            get_writer().write(self.stats_file, json.dumps(self.stats, ensure_ascii=False, indent=2))
+            self.games_since_snapshot = 0
             return True
-        except IOError as e:
+        except (TypeError, ValueError) as e:
             print(f"保存统计数据失败: {e}")
             return False
     
@@ -67,34 +136,53 @@ class StatisticsManager:
             self.stats['last_session_date'] = today
     
     def end_session(self, play_time: float) -> None:
-        """结束游戏会话"""
+        """结束未完成的游戏会话（完成的游戏由 record_game 记录时长）"""
         if self.stats['session_start_time']:
             session_time = play_time
             self.stats['total_play_time'] += session_time
             self.stats['session_start_time'] = None
+            # 这段时长不在日志中，需要写入快照
+            self.save_statistics()
     
-    def record_game(self, score: int, level: int, lines_cleared: int, difficulty: str) -> None:
-        """记录一场游戏"""
-        self.stats['total_games'] += 1
-        self.stats['total_score'] += score
-        self.stats['total_lines_cleared'] += lines_cleared
-        
-        # 更新最高记录
-        if score > self.stats['highest_score']:
-            self.stats['highest_score'] = score
-        
-        if level > self.stats['highest_level']:
-            self.stats['highest_level'] = level
-        
-        if lines_cleared > self.stats['most_lines_cleared']:
-            self.stats['most_lines_cleared'] = lines_cleared
-        
-        # 更新难度统计
-        if difficulty in self.stats['games_per_difficulty']:
-            self.stats['games_per_difficulty'][difficulty] += 1
+    def record_game(self, score: int, level: int, lines_cleared: int, difficulty: str,
+                    duration: float = 0.0, pieces: int = 0) -> bool:
+        """记录一场游戏：向日志追加一行（由后台线程写入）并累加到汇总数据"""
+        game = {
+            'score': score,
+            'level': level,
+            'lines': lines_cleared,
+            'difficulty': difficulty,
+            'duration': round(duration, 3),
+            'pieces': pieces,
+            'timestamp': datetime.now().timestamp()
+        }
+        try:
+            line = (json.dumps(game, ensure_ascii=False) + '\n').encode('utf-8')
+        except (TypeError, ValueError) as e:
+            print(f"保存游戏记录失败: {e}")
+            return False
+        # 追加与快照都交给同一个写入线程按顺序执行，快照中的 log_offset 不会超前于磁盘上的日志
+        get_writer().append(self.games_file, line)
         
-        # 保存统计数据
-        self.save_statistics()
+        self._accumulate(game)
+        self.stats['log_offset'] += len(line)
+        self.stats['session_start_time'] = None
+        self.games_since_snapshot += 1
+        if self.games_since_snapshot >= STATS_SNAPSHOT_INTERVAL:
+            self.save_statistics()
+        return True
+    
+    def iter_games(self) -> Iterator[Dict[str, Any]]:
+        """逐条读取日志中已写入磁盘的全部游戏记录"""
+        if not os.path.exists(self.games_file):
+            return
+        with open(self.games_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.endswith('\n'):
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
     
     def get_statistics(self) -> Dict[str, Any]:
         """获取统计数据"""
@@ -118,24 +206,10 @@ class StatisticsManager:
     
     
     def reset_statistics(self) -> bool:
-        """重置统计数据"""
-        self.stats = {
-            'total_games': 0,
-            'total_play_time': 0,
-            'total_lines_cleared': 0,
-            'total_score': 0,
-            'highest_score': 0,
-            'highest_level': 0,
-            'most_lines_cleared': 0,
-            'games_per_difficulty': {
-                'EASY': 0,
-                'MEDIUM': 0,
-                'HARD': 0,
-                'EXPERT': 0
-            },
-            'session_start_time': None,
-            'last_session_date': None
-        }
+        """重置统计数据（同时清空游戏记录）"""
+        # 排在已提交的追加之后清空日志，再写入空快照
+        get_writer().write(self.games_file, '')
+        self.stats = self._empty_stats()
         return self.save_statistics()
     
     def export_statistics(self, filename: str) -> bool:
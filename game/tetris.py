@@ -1,8 +1,83 @@
 import random
 from .constants import SHAPES, PIECE_COLORS, GRID_WIDTH, GRID_HEIGHT
 
+# 旋转方向数量（0 为初始方向，每次顺时针旋转 90 度）
+ROTATION_COUNT = 4
+
+# 墙踢（Wall Kick）候选偏移
+WALL_KICKS = ((-1, 0), (1, 0), (0, -1), (-1, -1), (1, -1))
+
+
+def _build_rotation_tables():
+    """在导入时预计算所有方块 7×4 个方向的形状、占用格、包围盒、行位掩码与列底部偏移"""
+    shapes, cells, sizes, masks, bottoms = [], [], [], [], []
+    for base_shape in SHAPES:
+        shape = tuple(tuple(row) for row in base_shape)
+        shape_rotations, cell_rotations, size_rotations, mask_rotations = [], [], [], []
+        bottom_rotations = []
+        for _ in range(ROTATION_COUNT):
+            shape_rotations.append(shape)
+            cell_rotations.append(tuple(
+                (x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell
+            ))
+            size_rotations.append((len(shape[0]), len(shape)))
+            mask_rotations.append(tuple(
+                sum(1 << x for x, cell in enumerate(row) if cell) for row in shape
+            ))
+            bottom_rotations.append(tuple(
+                max(y for y, row in enumerate(shape) if row[x]) for x in range(len(shape[0]))
+            ))
+            # 顺时针旋转90度
+            shape = tuple(zip(*shape[::-1]))
+        shapes.append(tuple(shape_rotations))
+        cells.append(tuple(cell_rotations))
+        sizes.append(tuple(size_rotations))
+        masks.append(tuple(mask_rotations))
+        bottoms.append(tuple(bottom_rotations))
+    return tuple(shapes), tuple(cells), tuple(sizes), tuple(masks), tuple(bottoms)
+
+
+# 以 [shape_index][rotation] 索引：形状矩阵、占用格偏移 (x, y)、包围盒 (宽, 高)、行位掩码、
+# 每列最低方块的行偏移
+PIECE_SHAPES, PIECE_CELLS, PIECE_SIZES, PIECE_MASKS, PIECE_BOTTOMS = _build_rotation_tables()
+
+
+# Zobrist 键表缓存：(宽, 高) -> keys[y][x]
+_ZOBRIST_KEYS = {}
+
+
+def zobrist_keys(width, height):
+    """返回指定尺寸棋盘的 Zobrist 随机键表（固定种子，同尺寸共享且跨进程一致）"""
+    size = (width, height)
+    if size not in _ZOBRIST_KEYS:
+        rng = random.Random(0x7E7215)
+        _ZOBRIST_KEYS[size] = tuple(
+            tuple(rng.getrandbits(64) for _ in range(width)) for _ in range(height)
+        )
+    return _ZOBRIST_KEYS[size]
+
+
+def zobrist_row(row_keys, mask):
+    """计算一行位掩码的 Zobrist 值"""
+    value = 0
+    while mask:
+        low_bit = mask & -mask
+        value ^= row_keys[low_bit.bit_length() - 1]
+        mask ^= low_bit
+    return value
+
+
+def zobrist_hash(rows, keys):
+    """从行位掩码完整计算棋盘的 Zobrist 哈希"""
+    value = 0
+    for y, mask in enumerate(rows):
+        if mask:
+            value ^= zobrist_row(keys[y], mask)
+    return value
+
+
 class Tetromino:
-    """俄罗斯方块类"""
+    """俄罗斯方块类（只保存方向索引，形状数据全部来自预计算表）"""
     
     def __init__(self, shape_index=None):
         """初始化俄罗斯方块"""
@@ -10,177 +85,348 @@ class Tetromino:
             shape_index = random.randint(0, len(SHAPES) - 1)
         
         self.shape_index = shape_index
-        self.shape = [row[:] for row in SHAPES[shape_index]]
+        self.rotation = 0
         self.color = PIECE_COLORS[shape_index]
-        self.x = GRID_WIDTH // 2 - len(self.shape[0]) // 2
+        self.x = GRID_WIDTH // 2 - PIECE_SIZES[shape_index][0][0] // 2
         self.y = 0
+    
+    @property
+    def shape(self):
+        """当前方向的形状矩阵（只读元组）"""
+        return PIECE_SHAPES[self.shape_index][self.rotation]
+    
+    @property
+    def cells(self):
+        """当前方向占用格相对左上角的偏移"""
+        return PIECE_CELLS[self.shape_index][self.rotation]
+    
+    @property
+    def masks(self):
+        """当前方向每一行的位掩码"""
+        return PIECE_MASKS[self.shape_index][self.rotation]
+    
+    @property
+    def width(self):
+        return PIECE_SIZES[self.shape_index][self.rotation][0]
+    
+    @property
+    def height(self):
+        return PIECE_SIZES[self.shape_index][self.rotation][1]
         
     def rotate(self):
-        """旋转方块"""
-        # 顺时针旋转90度
-        rotated = list(zip(*self.shape[::-1]))
-        return [list(row) for row in rotated]
+        """返回顺时针旋转90度后的方向索引"""
+        return (self.rotation + 1) % ROTATION_COUNT
     
     def get_shape_positions(self):
         """获取方块占据的所有位置"""
-        positions = []
-        for y, row in enumerate(self.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    positions.append((self.x + x, self.y + y))
-        return positions
+        return [(self.x + x, self.y + y) for x, y in self.cells]
     
     def copy(self):
         """创建方块副本"""
         new_piece = Tetromino(self.shape_index)
-        new_piece.shape = [row[:] for row in self.shape]
+        new_piece.rotation = self.rotation
         new_piece.x = self.x
         new_piece.y = self.y
         return new_piece
 
 class GameBoard:
-    """游戏板类"""
+    """游戏板类
+
+    已锁定的方块以位棋盘形式保存：``rows[y]`` 是第 y 行的整数位掩码（第 x 位表示第 x 列
+    被占用），碰撞、锁定与满行检测都只需少量移位与按位运算。``grid`` 是与之平行的颜色平面，
+    仅供渲染使用（0 表示空，1-7 表示方块颜色）。``heights[x]`` 是第 x 列的表面高度，
+    在锁定时增量更新，用于直接计算落点距离。``hash`` 是已锁定方块的 Zobrist 哈希，
+    在 ``lock_piece`` 与 ``clear_lines`` 中增量维护，供 AI 搜索识别重复局面。
+    ``dirty`` 为列表时，每次改变画面的操作都会追加受影响的格子区域 (x, y, 宽, 高)，
+    供局部重绘使用；为 None 时不做记录。``version`` 在已锁定方块每次变化时递增，
+    渲染层据此判断是否需要重建已锁定方块的图层。
+    """
     
-    def __init__(self):
-        """初始化游戏板"""
-        self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, rng=None):
+        """初始化游戏板（rng 用于生成方块序列，默认使用全局 random）"""
+        self.rng = rng or random
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        self.rows = [0] * height
+        self.grid = [[0] * width for _ in range(height)]
+        self._empty_row = [0] * width
+        self.heights = [0] * width
+        self.zobrist_keys = zobrist_keys(width, height)
+        self.hash = 0
+        self.last_cleared_rows = []
+        self.version = 0
         self.current_piece = None
         self.next_piece = None
         self.ghost_piece = None
+        self.ghost_distance = 0
+        self.dirty = None
+        
+    def _mark_dirty(self, x, y, width, height):
+        """记录需要重绘的格子区域"""
+        if self.dirty is not None:
+            self.dirty.append((x, y, width, height))
+    
+    def _mark_piece_dirty(self):
+        """记录当前方块及其幽灵方块覆盖的区域"""
+        piece = self.current_piece
+        if self.dirty is not None and piece:
+            self.dirty.append((piece.x, piece.y, piece.width, piece.height + self.ghost_distance))
         
     def create_new_piece(self):
         """创建新方块"""
-        self.current_piece = self.next_piece if self.next_piece else Tetromino()
-        self.next_piece = Tetromino()
+        self.current_piece = self.next_piece if self.next_piece else self._random_piece()
+        self.next_piece = self._random_piece()
+        self.current_piece.x = self.width // 2 - self.current_piece.width // 2
         self.update_ghost_piece()
+        self._mark_piece_dirty()
         
         # 检查游戏是否结束
         if not self._is_valid_position(self.current_piece, 0, 0):
             return False
         return True
     
-    def _is_valid_position(self, piece, dx=0, dy=0, test_shape=None):
-        """检查方块位置是否有效"""
-        shape = test_shape if test_shape else piece.shape
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    new_x = piece.x + x + dx
-                    new_y = piece.y + y + dy
-                    
-                    # 检查边界
-                    if new_x < 0 or new_x >= GRID_WIDTH or new_y >= GRID_HEIGHT:
-                        return False
-                    
-                    # 检查碰撞
-                    if new_y >= 0 and self.grid[new_y][new_x] != 0:
-                        return False
+    def _random_piece(self):
+        return Tetromino(self.rng.randint(0, len(SHAPES) - 1))
+    
+    def _is_valid_position(self, piece, dx=0, dy=0, rotation=None):
+        """检查方块位置是否有效（rotation 为 None 时使用方块当前方向）"""
+        if rotation is None:
+            rotation = piece.rotation
+        width, height = PIECE_SIZES[piece.shape_index][rotation]
+        x = piece.x + dx
+        y = piece.y + dy
+        
+        # 检查边界（形状总是裁剪到包围盒，左右两列必有方块）
+        if x < 0 or x + width > self.width or y + height > self.height:
+            return False
+        
+        # 检查碰撞
+        rows = self.rows
+        for row_y, mask in enumerate(PIECE_MASKS[piece.shape_index][rotation]):
+            grid_y = y + row_y
+            if grid_y >= 0 and rows[grid_y] & (mask << x):
+                return False
         return True
     
     def move_piece(self, dx, dy):
         """移动方块"""
         if self.current_piece and self._is_valid_position(self.current_piece, dx, dy):
+            self._mark_piece_dirty()
             self.current_piece.x += dx
             self.current_piece.y += dy
             self.update_ghost_piece()
+            self._mark_piece_dirty()
             return True
         return False
     
+    def place_piece(self, rotation, x):
+        """把当前方块直接设为指定方向与列（供 AI 使用），位置无效时返回 False"""
+        piece = self.current_piece
+        if not piece or not self._is_valid_position(piece, x - piece.x, 0, rotation):
+            return False
+        self._mark_piece_dirty()
+        piece.rotation = rotation
+        piece.x = x
+        self.update_ghost_piece()
+        self._mark_piece_dirty()
+        return True
+    
     def rotate_piece(self):
         """旋转方块"""
         if not self.current_piece:
             return False
             
         # 尝试旋转
-        rotated_shape = self.current_piece.rotate()
+        rotation = self.current_piece.rotate()
         
         # 检查旋转后的位置是否有效
-        if self._is_valid_position(self.current_piece, 0, 0, rotated_shape):
-            self.current_piece.shape = rotated_shape
+        if self._is_valid_position(self.current_piece, 0, 0, rotation):
+            self._mark_piece_dirty()
+            self.current_piece.rotation = rotation
             self.update_ghost_piece()
+            self._mark_piece_dirty()
             return True
             
         # 尝试墙踢（Wall Kick）
-        for kick_x, kick_y in [(-1, 0), (1, 0), (0, -1), (-1, -1), (1, -1)]:
-            if self._is_valid_position(self.current_piece, kick_x, kick_y, rotated_shape):
+        for kick_x, kick_y in WALL_KICKS:
+            if self._is_valid_position(self.current_piece, kick_x, kick_y, rotation):
+                self._mark_piece_dirty()
                 self.current_piece.x += kick_x
                 self.current_piece.y += kick_y
-                self.current_piece.shape = rotated_shape
+                self.current_piece.rotation = rotation
                 self.update_ghost_piece()
+                self._mark_piece_dirty()
                 return True
                 
         return False
     
+    def drop_distance(self, piece):
+        """计算方块还能下落的行数"""
+        bottoms = PIECE_BOTTOMS[piece.shape_index][piece.rotation]
+        surface = self.height
+        heights = self.heights
+        distance = self.height
+        for x, bottom in enumerate(bottoms):
+            column_distance = surface - heights[piece.x + x] - 1 - (piece.y + bottom)
+            if column_distance < distance:
+                distance = column_distance
+        if distance >= 0:
+            return distance
+        
+        # 方块位于悬空结构下方，列高度无法给出答案，逐行检查
+        distance = 0
+        while self._is_valid_position(piece, 0, distance + 1):
+            distance += 1
+        return distance
+    
     def update_ghost_piece(self):
         """更新幽灵方块（显示方块落点）"""
-        if not self.current_piece:
+        piece = self.current_piece
+        if not piece:
             self.ghost_piece = None
+            self.ghost_distance = 0
             return
-            
-        ghost = self.current_piece.copy()
-        while self._is_valid_position(ghost, 0, 1):
-            ghost.y += 1
+        
+        ghost = self.ghost_piece
+        if ghost is None or ghost.shape_index != piece.shape_index:
+            ghost = Tetromino(piece.shape_index)
+        ghost.rotation = piece.rotation
+        ghost.x = piece.x
+        self.ghost_distance = self.drop_distance(piece)
+        ghost.y = piece.y + self.ghost_distance
         self.ghost_piece = ghost
     
+    def hard_drop(self):
+        """将当前方块直接移动到幽灵方块位置，返回下落的行数"""
+        if not self.current_piece:
+            return 0
+        distance = self.ghost_distance
+        self._mark_piece_dirty()
+        self.current_piece.y += distance
+        self.ghost_distance = 0
+        return distance
+    
     def lock_piece(self):
         """锁定方块到游戏板"""
-        if not self.current_piece:
+        piece = self.current_piece
+        if not piece:
             return 0
-            
-        for y, row in enumerate(self.current_piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    grid_y = self.current_piece.y + y
-                    grid_x = self.current_piece.x + x
-                    if 0 <= grid_y < GRID_HEIGHT and 0 <= grid_x < GRID_WIDTH:
-                        self.grid[grid_y][grid_x] = self.current_piece.shape_index + 1  # 1-7表示不同颜色的方块
-        
-        lines_cleared = self.clear_lines()
+        
+        self._mark_piece_dirty()
+        for row_y, mask in enumerate(piece.masks):
+            grid_y = piece.y + row_y
+            if 0 <= grid_y < self.height:
+                self.rows[grid_y] |= mask << piece.x
+        color = piece.shape_index + 1  # 1-7表示不同颜色的方块
+        surface = self.height
+        for x, y in piece.cells:
+            grid_y = piece.y + y
+            if 0 <= grid_y < self.height:
+                self.grid[grid_y][piece.x + x] = color
+                self.hash ^= self.zobrist_keys[grid_y][piece.x + x]
+                if surface - grid_y > self.heights[piece.x + x]:
+                    self.heights[piece.x + x] = surface - grid_y
+        self.version += 1
+        
+        # 只有方块覆盖的行可能被填满
+        touched_rows = range(max(piece.y, 0), min(piece.y + piece.height, self.height))
+        self.last_cleared_rows = self.clear_lines(touched_rows)
         self.current_piece = None
         self.ghost_piece = None
-        return lines_cleared
+        self.ghost_distance = 0
+        return len(self.last_cleared_rows)
     
-    def clear_lines(self):
-        """清除完整的行"""
-        lines_to_clear = []
+    def clear_lines(self, candidate_rows=None):
+        """清除完整的行，返回被清除的行号（升序）
+
+        只检查 candidate_rows 中的行（默认检查全部行），并在一次自下而上的扫描中
+        将保留的行下移到位，被清除行的颜色缓冲区会被清空后复用到顶部。
+        """
+        rows = self.rows
+        full_row = self.full_row
+        if candidate_rows is None:
+            candidate_rows = range(self.height)
+        lines_to_clear = [y for y in candidate_rows if rows[y] == full_row]
+        if not lines_to_clear:
+            return lines_to_clear
         
-        # 找出需要清除的行
-        for y in range(GRID_HEIGHT):
-            if all(cell != 0 for cell in self.grid[y]):
-                lines_to_clear.append(y)
+        # 最高非空行之上都是空行，无需移动
+        grid = self.grid
+        top = self.height - max(self.heights)
+        cleared = set(lines_to_clear)
+        free_buffers = [grid[y] for y in lines_to_clear]
         
-        # 清除行并下移
+        # 清除行并下移（单次扫描），同时更新哈希
+        keys = self.zobrist_keys
         for y in lines_to_clear:
-            del self.grid[y]
-            self.grid.insert(0, [0 for _ in range(GRID_WIDTH)])
+            self.hash ^= zobrist_row(keys[y], full_row)
+        dst = lines_to_clear[-1]
+        for src in range(dst, top - 1, -1):
+            if src in cleared:
+                continue
+            mask = rows[src]
+            if dst != src and mask:
+                self.hash ^= zobrist_row(keys[src], mask) ^ zobrist_row(keys[dst], mask)
+            rows[dst] = mask
+            grid[dst] = grid[src]
+            dst -= 1
+        for y in range(top, dst + 1):
+            rows[y] = 0
+            buffer = free_buffers.pop()
+            buffer[:] = self._empty_row
+            grid[y] = buffer
         
-        return len(lines_to_clear)
+        self._mark_dirty(0, top, self.width, lines_to_clear[-1] - top + 1)
+        self._update_heights(top)
+        self.version += 1
+        return lines_to_clear
+    
+    def _update_heights(self, top=0):
+        """从行位掩码重新计算每列表面高度（仅在消行后需要，top 之上必须全为空行）"""
+        heights = self.heights
+        for x in range(self.width):
+            heights[x] = 0
+        seen = 0
+        for y in range(top, self.height):
+            new_columns = self.rows[y] & ~seen
+            if new_columns:
+                seen |= new_columns
+                while new_columns:
+                    low_bit = new_columns & -new_columns
+                    heights[low_bit.bit_length() - 1] = self.height - y
+                    new_columns ^= low_bit
+                if seen == self.full_row:
+                    break
     
     def get_game_state(self):
         """获取游戏板状态（用于AI）"""
-        state = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        state = [[0 for _ in range(self.width)] for _ in range(self.height)]
         
         # 复制已锁定的方块
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                if self.grid[y][x] is not None:
+        for y in range(self.height):
+            for x in range(self.width):
+                if self.grid[y][x] != 0:
                     state[y][x] = 1
         
         # 添加当前方块
         if self.current_piece:
-            for y, row in enumerate(self.current_piece.shape):
-                for x, cell in enumerate(row):
-                    if cell:
-                        grid_y = self.current_piece.y + y
-                        grid_x = self.current_piece.x + x
-                        if 0 <= grid_y < GRID_HEIGHT and 0 <= grid_x < GRID_WIDTH:
-                            state[grid_y][grid_x] = 1
+            for grid_x, grid_y in self.current_piece.get_shape_positions():
+                if 0 <= grid_y < self.height and 0 <= grid_x < self.width:
+                    state[grid_y][grid_x] = 1
         
         return state
     
     def reset(self):
         """重置游戏板"""
-        self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        self.rows = [0] * self.height
+        self.grid = [[0] * self.width for _ in range(self.height)]
+        self.heights = [0] * self.width
+        self.hash = 0
+        self.last_cleared_rows = []
+        self.version += 1
         self.current_piece = None
         self.next_piece = None
-        self.ghost_piece = None
\ No newline at end of file
+        self.ghost_piece = None
+        self.ghost_distance = 0
+        self._mark_dirty(0, 0, self.width, self.height)
@@ -0,0 +1,27 @@
+from .constants import TEXT_CACHE_SIZE
+from .lru import LRUCache
+
+
+class TextCache(LRUCache):
+    """文字渲染缓存
+
+    按 (字体, 文本, 颜色, 抗锯齿) 缓存 ``font.render`` 生成的 Surface，超出容量时按 LRU
+    淘汰。返回的 Surface 会被多帧共享，调用方只能 blit，不能修改。
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        """初始化文字缓存"""
+        super().__init__(max_entries)
+
+    def render(self, font, text: str, antialias: bool, color):
+        """与 font.render 参数一致，命中缓存时直接返回已渲染的 Surface"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self.store(key, surface)
+        return surface
+
+    def clear(self) -> None:
+        """清空缓存（语言或主题切换时调用，保留命中率计数）"""
+        self.entries.clear()
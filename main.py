@@ -7,6 +7,7 @@
 版本: 1.0.0
 """
 
+import argparse
 import sys
 import os
 
@@ -15,10 +16,21 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from game.engine import GameEngine
 
+def parse_args(argv=None):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description="Advanced Tetris")
+    parser.add_argument(
+        '--frame-profile', nargs='?', const=os.path.join('data', 'frame_profile.json'), default=None,
+        metavar='PATH', help="export per-phase frame timings to PATH on exit (F3 toggles the HUD)"
+    )
+    parser.add_argument('--profile-startup', action='store_true', help="print a startup timing breakdown")
+    return parser.parse_args(argv)
+
 def main():
     """主函数"""
+    args = parse_args()
     try:
-        game = GameEngine()
+        game = GameEngine(profile_path=args.frame_profile, profile_startup=args.profile_startup)
         game.run()
     except KeyboardInterrupt:
         print("\n游戏被用户中断")